@@ -1,37 +1,93 @@
 # jenkins_connector.py
 
+import asyncio
+import functools
+import heapq
 import requests
-import base64
 import logging
 import os
+import threading
+import time
 import urllib.parse
 import urllib3
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from itertools import chain
 from requests.auth import HTTPBasicAuth
 from requests.exceptions import RequestException, HTTPError, ConnectionError, Timeout
 from requests.adapters import HTTPAdapter
 from urllib3.util.retry import Retry
 from dotenv import load_dotenv
 
+# Prefer orjson for decoding large Jenkins responses when available
+try:
+    import orjson
+    _loads = orjson.loads
+except ImportError:
+    import json
+    _loads = json.loads
+
+# httpx is only needed for AsyncJenkinsConnector
+try:
+    import httpx
+except ImportError:
+    httpx = None
+
+# ijson enables incremental parsing of large /computer/api/json responses
+try:
+    import ijson
+except ImportError:
+    ijson = None
+
 
 # Suppress insecure request warnings
 urllib3.disable_warnings(urllib3.exceptions.InsecureRequestWarning)
 
-# Load environment variables
-load_dotenv()
-
-# Configure logging
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
-)
+# Logging and .env loading are left to the application entry point so that
+# importing this module as a library has no side effects
 logger = logging.getLogger(__name__)
 
 class JenkinsAuthenticationError(Exception):
     """Custom exception for Jenkins authentication issues"""
     pass
 
+# Failures the list-returning helpers swallow: transport and auth errors,
+# missing response fields, and malformed bodies (json/orjson decode errors
+# are ValueError subclasses; ijson raises its own hierarchy)
+_FETCH_ERRORS = (RequestException, JenkinsAuthenticationError, KeyError, ValueError)
+if ijson is not None:
+    _FETCH_ERRORS += (ijson.JSONError,)
+
+
+# Explicit field projection for /computer/api/json; every field listed here is
+# consumed downstream, and adding one changes the response size noticeably
+_EXECUTABLE_FIELDS = ('currentExecutable[url,fullDisplayName,displayName,timestamp,'
+                      'estimatedDuration,number,building,result,id,'
+                      'job[name,fullName,displayName]]')
+_RUNNING_BUILDS_TREE = (f'computer[executors[{_EXECUTABLE_FIELDS}],'
+                        f'oneOffExecutors[{_EXECUTABLE_FIELDS}]]')
+
+# Default projection for /queue/api/json; covers every field the dashboards
+# format without pulling the fat default payload
+_QUEUE_TREE = 'items[id,why,inQueueSince,task[name,url]]'
+
+
+# Upper bound on cached responses; distinct per-build endpoints would
+# otherwise accumulate payloads for the life of a long-running process
+_CACHE_MAX = 512
+
+
+@functools.lru_cache(maxsize=4096)
+def _quote_job(job_name):
+    """
+    URL-encode a job name, caching the result.
+
+    Job names repeat on every poll, so quoting each one once is enough.
+    """
+    return urllib.parse.quote(job_name)
+
 class JenkinsConnector:
-    def __init__(self, jenkins_url, username=None, api_token=None, verify_ssl=False, timeout=30):
+    def __init__(self, jenkins_url, username=None, api_token=None, verify_ssl=False, timeout=30, pool_size=32):
         """
         Initialize Jenkins connection with authentication handling.
 
@@ -40,29 +96,37 @@ class JenkinsConnector:
         :param api_token: Jenkins API token (optional, can use environment variable)
         :param verify_ssl: Whether to verify SSL certificates (default: False)
         :param timeout: Connection timeout in seconds (default: 30)
+        :param pool_size: Size of the urllib3 connection pool (default: 32)
         """
-        # Check if credentials are embedded in the URL
-        if '@' in jenkins_url:
-            # Extract credentials and clean URL
-            try:
-                auth_part, server_part = jenkins_url.split('@', 1)
-                protocol = auth_part.split('://', 1)[0]
-                credentials = auth_part.split('://', 1)[1]
-                embedded_username, embedded_token = credentials.split(':', 1)
-
-                # Set the clean URL without credentials
-                self.jenkins_url = f"{protocol}://{server_part}".rstrip('/')
-
-                # Use embedded credentials if provided
-                self.username = username or embedded_username
-                self.api_token = api_token or embedded_token
-
-                logger.info(f"Using credentials embedded in URL for {self.jenkins_url}")
-            except Exception as e:
-                logger.error(f"Failed to parse credentials from URL: {e}")
-                self.jenkins_url = jenkins_url.rstrip('/')
-                self.username = username or os.environ.get('JENKINS_USERNAME')
-                self.api_token = api_token or os.environ.get('JENKINS_API_TOKEN')
+        # Check if credentials are embedded in the URL; urlsplit handles
+        # percent-encoded passwords, IPv6 hosts and tokens containing '@'.
+        # The netloc properties raise ValueError on a malformed netloc
+        # (e.g. a non-numeric port); fall back to the plain-URL path then
+        parts = urllib.parse.urlsplit(jenkins_url)
+        try:
+            embedded_username = parts.username
+            port = parts.port
+        except ValueError as e:
+            logger.warning(f"Could not parse credentials from URL: {e}")
+            embedded_username = None
+            port = None
+
+        if embedded_username:
+            # Rebuild the clean URL without credentials
+            netloc = parts.hostname or ''
+            if port:
+                netloc = f'{netloc}:{port}'
+            self.jenkins_url = urllib.parse.urlunsplit(
+                (parts.scheme, netloc, parts.path, parts.query, parts.fragment)
+            ).rstrip('/')
+
+            # Use embedded credentials if provided
+            self.username = username or urllib.parse.unquote(embedded_username)
+            self.api_token = (api_token
+                              or urllib.parse.unquote(parts.password or '')
+                              or os.environ.get('JENKINS_API_TOKEN'))
+
+            logger.info(f"Using credentials embedded in URL for {self.jenkins_url}")
         else:
             # Standard URL without embedded credentials
             self.jenkins_url = jenkins_url.rstrip('/')
@@ -81,12 +145,16 @@ class JenkinsConnector:
         # Connection settings
         self.verify_ssl = verify_ssl
         self.timeout = timeout
+        self.pool_size = pool_size
 
-        # Prepare authentication methods
+        # Prepare authentication; HTTPBasicAuth on the session adds the
+        # Authorization header per request, no need to pre-bake it
         self.basic_auth = HTTPBasicAuth(self.username, self.api_token)
         self.headers = {
-            'Authorization': f'Basic {base64.b64encode(f"{self.username}:{self.api_token}".encode()).decode()}',
-            'Accept': 'application/json'
+            'Accept': 'application/json',
+            # Large job/executor trees compress 5-10x; be explicit so the
+            # header survives any future wholesale replacement of the defaults
+            'Accept-Encoding': 'gzip, deflate'
         }
 
         # Create a session for persistent connections
@@ -95,14 +163,30 @@ class JenkinsConnector:
         self.session.headers.update(self.headers)
         self.session.verify = self.verify_ssl
 
-        # Configure retry strategy
-        retry_strategy = Retry(
+        # Configure retry strategy; honor Retry-After on 429s and leave status
+        # handling to the callers so existing error paths see the response
+        retry_kwargs = dict(
             total=3,
             backoff_factor=0.5,
-            status_forcelist=[429, 500, 502, 503, 504],
-            allowed_methods=["GET", "POST"]
+            status_forcelist=(429, 500, 502, 503, 504),
+            allowed_methods=frozenset(("GET", "POST")),
+            respect_retry_after_header=True,
+            raise_on_status=False
+        )
+        try:
+            # Jitter keeps fleets of dashboards from retrying in lockstep
+            retry_strategy = Retry(backoff_jitter=0.25, **retry_kwargs)
+        except TypeError:
+            # urllib3 < 2.0 has no backoff_jitter
+            retry_strategy = Retry(**retry_kwargs)
+        # Size the pool for fan-out workloads (e.g. get_latest_builds) so
+        # keep-alive connections are not discarded and re-handshaked
+        adapter = HTTPAdapter(
+            pool_connections=self.pool_size,
+            pool_maxsize=self.pool_size,
+            max_retries=retry_strategy,
+            pool_block=False
         )
-        adapter = HTTPAdapter(max_retries=retry_strategy)
         self.session.mount("http://", adapter)
         self.session.mount("https://", adapter)
 
@@ -115,8 +199,44 @@ class JenkinsConnector:
             self.session.proxies = proxies
             logger.info("Using proxy settings from environment variables")
 
-        # Crumb data will be obtained when needed
+        # Crumb data will be obtained when needed; the lock keeps concurrent
+        # callers from racing to fetch it, and _crumb_fetched remembers a
+        # negative result so CSRF-disabled servers aren't re-queried per POST
         self.crumb = None
+        self._crumb_lock = threading.Lock()
+        self._crumb_fetched = False
+
+        # Short-lived response cache so polling dashboards don't re-fetch
+        # identical data from Jenkins on every tick; LRU-bounded so distinct
+        # per-build endpoints can't grow it without limit
+        self._cache = OrderedDict()
+        self._cache_ttl = 5.0
+        # Validators (ETag/Last-Modified) per request for conditional GETs;
+        # a 304 lets us reuse the cached payload without re-parsing anything
+        self._cond_headers = {}
+        # Job lists change rarely, so they get a longer TTL of their own
+        self._jobs_cache = None
+        self._jobs_cache_time = 0.0
+        self._jobs_cache_ttl = 30.0
+
+    def _cache_store(self, cache_key, result):
+        """
+        Store a decoded payload in the response cache, evicting the least
+        recently used entry (and its validators) beyond _CACHE_MAX keys.
+        """
+        self._cache[cache_key] = (time.monotonic(), result)
+        self._cache.move_to_end(cache_key)
+        if len(self._cache) > _CACHE_MAX:
+            old_key, _ = self._cache.popitem(last=False)
+            self._cond_headers.pop(old_key, None)
+
+    def invalidate(self):
+        """
+        Drop all cached responses so the next calls hit Jenkins directly.
+        """
+        self._cache.clear()
+        self._cond_headers.clear()
+        self._jobs_cache = None
 
     def _validate_credentials(self):
         """
@@ -189,40 +309,53 @@ class JenkinsConnector:
 
         :return: Crumb data as dictionary or None if request fails
         """
-        if self.crumb:
+        if self._crumb_fetched:
             return self.crumb
 
-        try:
-            response = self.session.get(
-                f'{self.jenkins_url}/crumbIssuer/api/json',
-                timeout=self.timeout
-            )
+        with self._crumb_lock:
+            # Another thread may have fetched the crumb while we waited
+            if self._crumb_fetched:
+                return self.crumb
 
-            if response.status_code == 200:
-                self.crumb = response.json()
-                logger.info("Successfully acquired CSRF crumb")
+            try:
+                response = self.session.get(
+                    f'{self.jenkins_url}/crumbIssuer/api/json',
+                    timeout=self.timeout
+                )
+
+                if response.status_code == 200:
+                    self.crumb = response.json()
+                    logger.info("Successfully acquired CSRF crumb")
+                elif response.status_code == 404:
+                    logger.warning("Crumb issuer not found - CSRF protection may be disabled")
+                    self.crumb = None
+                else:
+                    logger.error(f"Failed to get crumb: HTTP {response.status_code}")
+                    self.crumb = None
+
+                # Cache the result either way so a missing issuer is not
+                # re-queried on every subsequent POST
+                self._crumb_fetched = True
                 return self.crumb
-            elif response.status_code == 404:
-                logger.warning("Crumb issuer not found - CSRF protection may be disabled")
+
+            except ConnectionError as e:
+                logger.error(f"Connection error while getting crumb: {e}")
                 return None
-            else:
-                logger.error(f"Failed to get crumb: HTTP {response.status_code}")
+            except Timeout as e:
+                logger.error(f"Timeout while getting crumb: {e}")
+                return None
+            except RequestException as e:
+                logger.error(f"Request error while getting crumb: {e}")
                 return None
-
-        except ConnectionError as e:
-            logger.error(f"Connection error while getting crumb: {e}")
-            return None
-        except Timeout as e:
-            logger.error(f"Timeout while getting crumb: {e}")
-            return None
-        except RequestException as e:
-            logger.error(f"Request error while getting crumb: {e}")
-            return None
 
     def _update_headers_with_crumb(self):
         """
         Update session headers with CSRF crumb if available.
         """
+        # Nothing to do when we already know the server issues no crumbs
+        if self._crumb_fetched and self.crumb is None:
+            return
+
         crumb_data = self.get_crumb()
         if crumb_data and 'crumbRequestField' in crumb_data and 'crumb' in crumb_data:
             self.session.headers.update({
@@ -245,16 +378,31 @@ class JenkinsConnector:
         if params is None:
             params = {}
 
-        full_url = f'{self.jenkins_url}{endpoint}'
+        # Serve recent identical requests from the cache
+        cache_key = (endpoint, frozenset(params.items()))
+        cached = self._cache.get(cache_key)
+        if cached and time.monotonic() - cached[0] < self._cache_ttl:
+            logger.debug("Cache hit for %s", endpoint)
+            self._cache.move_to_end(cache_key)
+            return cached[1]
+
+        full_url = self.jenkins_url + endpoint
 
         try:
-            # Attempt connection
+            # Attempt connection, revalidating any previously cached payload
             response = self.session.get(
                 full_url,
                 params=params,
-                timeout=timeout
+                timeout=timeout,
+                headers=self._cond_headers.get(cache_key)
             )
 
+            # Nothing changed on the server - reuse the cached payload
+            if response.status_code == 304 and cached:
+                logger.debug("Not modified, serving cached data for %s", endpoint)
+                self._cache_store(cache_key, cached[1])
+                return cached[1]
+
             # Raise an exception for bad HTTP responses
             response.raise_for_status()
 
@@ -264,7 +412,19 @@ class JenkinsConnector:
             # Check if the response is JSON
             content_type = response.headers.get('Content-Type', '')
             if 'application/json' in content_type or 'text/json' in content_type:
-                return response.json()
+                result = _loads(response.content)
+                self._cache_store(cache_key, result)
+
+                # Remember the validators so the next poll can be conditional
+                cond = {}
+                if response.headers.get('ETag'):
+                    cond['If-None-Match'] = response.headers['ETag']
+                if response.headers.get('Last-Modified'):
+                    cond['If-Modified-Since'] = response.headers['Last-Modified']
+                if cond:
+                    self._cond_headers[cache_key] = cond
+
+                return result
             else:
                 logger.warning(f"Response is not JSON. Content-Type: {content_type}")
                 return response.text
@@ -297,6 +457,32 @@ class JenkinsConnector:
             logger.error(f"Request failed: {e}")
             raise
 
+    def _post_once(self, full_url, data, params, timeout):
+        """
+        Issue a single POST and decode the response.
+
+        :param full_url: Fully-qualified URL to post to
+        :param data: Data to send (dict or None)
+        :param params: URL parameters (dict or None)
+        :param timeout: Request timeout in seconds
+        :return: Parsed JSON for JSON responses, otherwise the Response object
+        :raises HTTPError: for bad HTTP status codes
+        """
+        response = self.session.post(
+            full_url,
+            data=data,
+            params=params,
+            timeout=timeout
+        )
+        response.raise_for_status()
+
+        logger.info(f'Successfully posted to {full_url}')
+
+        content_type = response.headers.get('Content-Type', '')
+        if 'application/json' in content_type or 'text/json' in content_type:
+            return _loads(response.content)
+        return response
+
     def post_to_jenkins(self, endpoint, data=None, params=None, timeout=None):
         """
         Make a POST request to Jenkins with CSRF protection.
@@ -316,28 +502,10 @@ class JenkinsConnector:
         # Update headers with CSRF crumb
         self._update_headers_with_crumb()
 
-        full_url = f'{self.jenkins_url}{endpoint}'
+        full_url = self.jenkins_url + endpoint
 
         try:
-            # Attempt connection with crumb in headers
-            response = self.session.post(
-                full_url,
-                data=data,
-                params=params,
-                timeout=timeout
-            )
-
-            # Raise an exception for bad HTTP responses
-            response.raise_for_status()
-
-            # Log successful request
-            logger.info(f'Successfully posted to {full_url}')
-
-            # Check if response is JSON, if so return it
-            content_type = response.headers.get('Content-Type', '')
-            if 'application/json' in content_type or 'text/json' in content_type:
-                return response.json()
-            return response
+            return self._post_once(full_url, data, params, timeout)
 
         except HTTPError as e:
             # If we get a 403 after adding crumb, it might be expired
@@ -345,24 +513,14 @@ class JenkinsConnector:
                 logger.warning("Possible expired crumb, attempting to refresh...")
                 # Clear the cached crumb and try to get a new one
                 self.crumb = None
+                self._crumb_fetched = False
                 self._update_headers_with_crumb()
 
                 # Try the request again with the new crumb
                 try:
-                    response = self.session.post(
-                        full_url,
-                        data=data,
-                        params=params,
-                        timeout=timeout
-                    )
-                    response.raise_for_status()
+                    result = self._post_once(full_url, data, params, timeout)
                     logger.info(f'Successfully posted to {full_url} after crumb refresh')
-
-                    content_type = response.headers.get('Content-Type', '')
-                    if 'application/json' in content_type or 'text/json' in content_type:
-                        return response.json()
-                    return response
-
+                    return result
                 except HTTPError as retry_e:
                     logger.error(f"HTTP error occurred after crumb refresh: {retry_e}")
                     raise
@@ -388,119 +546,135 @@ class JenkinsConnector:
 
         :return: List of job names or empty list if request fails
         """
+        if self._jobs_cache is not None and time.monotonic() - self._jobs_cache_time < self._jobs_cache_ttl:
+            return self._jobs_cache
+
         try:
             info = self.get_jenkins_info()
             if info and 'jobs' in info:
-                return [job['name'] for job in info['jobs']]
+                self._jobs_cache = [job['name'] for job in info['jobs']]
+                self._jobs_cache_time = time.monotonic()
+                return self._jobs_cache
             return []
-        except Exception as e:
+        except _FETCH_ERRORS as e:
             logger.error(f'Failed to list jobs: {e}')
             return []
 
-    def get_build_queue(self):
+    def get_build_queue(self, tree=None):
         """
         Get information about builds in the queue.
 
+        :param tree: Optional tree filter overriding the default projection
         :return: List of queued builds or empty list if request fails
         """
         try:
-            queue_info = self.get_jenkins_info('/queue/api/json')
+            params = {'tree': tree or _QUEUE_TREE}
+            queue_info = self.get_jenkins_info('/queue/api/json', params=params)
             if queue_info and 'items' in queue_info:
                 return queue_info['items']
             return []
-        except Exception as e:
+        except _FETCH_ERRORS as e:
             logger.error(f'Failed to get build queue: {e}')
             return []
 
-    def get_running_builds(self):
+    def _normalize_build(self, build):
+        """
+        Enhance a build dict in place with job name and display name fields.
+
+        :param build: currentExecutable dictionary from the executor tree
+        """
+        # Enhance build info with job name
+        job = build.get('job')
+        if job and 'name' in job:
+            build['jobName'] = job['name']
+            if 'fullName' in job:
+                build['jobFullName'] = job['fullName']
+            if 'displayName' in job:
+                build['jobDisplayName'] = job['displayName']
+
+        # For display name, prioritize fullDisplayName which contains more context
+        if build.get('fullDisplayName'):
+            build['displayName'] = build['fullDisplayName']
+        elif 'displayName' not in build:
+            build['displayName'] = f"#{build.get('number', 'N/A')}"
+
+    def _iter_computer_nodes(self, params):
+        """
+        Stream /computer/api/json and yield node dicts one at a time.
+
+        Incremental parsing keeps peak memory low on controllers whose
+        executor tree runs to megabytes of JSON.
+
+        :param params: URL parameters for the computer API request
+        :return: Generator of node dictionaries
+        """
+        response = self.session.get(
+            self.jenkins_url + '/computer/api/json',
+            params=params,
+            timeout=self.timeout,
+            stream=True
+        )
+        try:
+            response.raise_for_status()
+            # Let urllib3 decompress the stream before ijson sees it
+            response.raw.decode_content = True
+            yield from ijson.items(response.raw, 'computer.item')
+        finally:
+            response.close()
+
+    def get_running_builds(self, tree=None):
         """
         Get information about builds currently running.
 
+        :param tree: Optional tree filter overriding the default projection
         :return: List of running builds or empty list if request fails
         """
         try:
-            # Using deeper tree and more specific fields to get all name information
+            # The explicit tree projection makes depth=1 sufficient
             params = {
-                'depth': 2,
-                'tree': 'computer[executors[currentExecutable[*,url,fullDisplayName,displayName,description,timestamp,estimatedDuration,number,building,result,job[*]]],oneOffExecutors[currentExecutable[*,url,fullDisplayName,displayName,description,timestamp,estimatedDuration,number,building,result,job[*]]]]'
+                'depth': 1,
+                'tree': tree or _RUNNING_BUILDS_TREE
             }
-            computer_info = self.get_jenkins_info('/computer/api/json', params=params)
+
+            if ijson is not None:
+                # Incrementally parse the (potentially huge) response
+                nodes = self._iter_computer_nodes(params)
+            else:
+                computer_info = self.get_jenkins_info('/computer/api/json', params=params)
+                if not computer_info or 'computer' not in computer_info:
+                    return []
+                nodes = computer_info['computer']
 
             running_builds = []
             seen_builds = set()  # Track builds we've already added by URL
+            debug_enabled = logger.isEnabledFor(logging.DEBUG)
 
-            if computer_info and 'computer' in computer_info:
-                for node in computer_info['computer']:
-                    # Check regular executors
-                    if 'executors' in node:
-                        for executor in node['executors']:
-                            if executor.get('currentExecutable'):
-                                build = executor['currentExecutable']
-                                # Only add if we haven't seen this build URL before
-                                build_url = build.get('url')
-                                if build_url and build_url not in seen_builds:
-                                    # Print full build info for debugging
-                                    logger.debug(f"Build info: {build}")
-
-                                    # Enhance build info with job name
-                                    if 'job' in build and 'name' in build['job']:
-                                        build['jobName'] = build['job']['name']
-                                        if 'fullName' in build['job']:
-                                            build['jobFullName'] = build['job']['fullName']
-                                        if 'displayName' in build['job']:
-                                            build['jobDisplayName'] = build['job']['displayName']
-
-                                    # For display name, prioritize fullDisplayName which contains more context
-                                    if 'fullDisplayName' in build and build['fullDisplayName']:
-                                        build['displayName'] = build['fullDisplayName']
-                                    elif 'displayName' not in build:
-                                        build['displayName'] = f"#{build.get('number', 'N/A')}"
-
-                                    # Log the display name for debugging
-                                    logger.info(f"Build display name: {build.get('displayName', 'N/A')}")
-
-                                    running_builds.append(build)
-                                    seen_builds.add(build_url)
-
-                    # Check one-off executors
-                    if 'oneOffExecutors' in node:
-                        for executor in node['oneOffExecutors']:
-                            if executor.get('currentExecutable'):
-                                build = executor['currentExecutable']
-                                # Only add if we haven't seen this build URL before
-                                build_url = build.get('url')
-                                if build_url and build_url not in seen_builds:
-                                    # Print full build info for debugging
-                                    logger.debug(f"Build info: {build}")
-
-                                    # Enhance build info with job name
-                                    if 'job' in build and 'name' in build['job']:
-                                        build['jobName'] = build['job']['name']
-                                        if 'fullName' in build['job']:
-                                            build['jobFullName'] = build['job']['fullName']
-                                        if 'displayName' in build['job']:
-                                            build['jobDisplayName'] = build['job']['displayName']
-
-                                    # For display name, prioritize fullDisplayName which contains more context
-                                    if 'fullDisplayName' in build and build['fullDisplayName']:
-                                        build['displayName'] = build['fullDisplayName']
-                                    elif 'displayName' not in build:
-                                        build['displayName'] = f"#{build.get('number', 'N/A')}"
-
-                                    # Log the display name for debugging
-                                    logger.info(f"Build display name: {build.get('displayName', 'N/A')}")
-
-                                    running_builds.append(build)
-                                    seen_builds.add(build_url)
-
-                # Additional logging for debugging
-                logger.info(f"Total running builds: {len(running_builds)}")
-                for build in running_builds:
-                    logger.info(f"Job: {build.get('jobName', 'Unknown')}, Display: {build.get('displayName', 'Unknown')}")
-
-                return running_builds
-        except Exception as e:
-                logger.error(f'Failed to get running builds: {e}')
+            for node in nodes:
+                # Regular and one-off executors get identical handling
+                for executor in chain(node.get('executors', ()), node.get('oneOffExecutors', ())):
+                    build = executor.get('currentExecutable')
+                    if not build:
+                        continue
+
+                    # Only add if we haven't seen this build URL before
+                    build_url = build.get('url')
+                    if not build_url or build_url in seen_builds:
+                        continue
+                    seen_builds.add(build_url)
+
+                    self._normalize_build(build)
+
+                    if debug_enabled:
+                        logger.debug("Build info: %s", build)
+                        logger.debug("Build display name: %s", build.get('displayName', 'N/A'))
+
+                    running_builds.append(build)
+
+            logger.info(f"Total running builds: {len(running_builds)}")
+
+            return running_builds
+        except _FETCH_ERRORS as e:
+            logger.error(f'Failed to get running builds: {e}')
         return []
 
     def build_job(self, job_name, parameters=None):
@@ -511,8 +685,11 @@ class JenkinsConnector:
         :param parameters: Dictionary of build parameters (for parameterized builds)
         :return: Response data or None if request fails
         """
+        # Triggering a build changes server state, so drop cached responses
+        self.invalidate()
+
         # URL encode the job name for safety
-        encoded_job_name = urllib.parse.quote(job_name)
+        encoded_job_name = _quote_job(job_name)
 
         try:
             if parameters:
@@ -535,7 +712,7 @@ class JenkinsConnector:
         :return: Job information dict or None if request fails
         """
         try:
-            encoded_job_name = urllib.parse.quote(job_name)
+            encoded_job_name = _quote_job(job_name)
             endpoint = f'/job/{encoded_job_name}/api/json'
             return self.get_jenkins_info(endpoint)
         except Exception as e:
@@ -551,13 +728,35 @@ class JenkinsConnector:
         :return: Build information dict or None if request fails
         """
         try:
-            encoded_job_name = urllib.parse.quote(job_name)
+            encoded_job_name = _quote_job(job_name)
             endpoint = f'/job/{encoded_job_name}/{build_number}/api/json'
             return self.get_jenkins_info(endpoint)
         except Exception as e:
             logger.error(f'Failed to get build info for {job_name} #{build_number}: {e}')
             return None
 
+    def _fetch_last_build(self, job_name):
+        """
+        Fetch detailed information about the last build of a single job.
+
+        :param job_name: Name of the job
+        :return: Build information dict (with jobName added) or None
+        """
+        job_info = self.get_job_info(job_name)
+
+        if job_info and 'lastBuild' in job_info and job_info['lastBuild']:
+            last_build_number = job_info['lastBuild'].get('number')
+
+            if last_build_number:
+                # Get detailed build info
+                build_info = self.get_build_info(job_name, last_build_number)
+
+                if build_info:
+                    # Add job name to the build info for reference
+                    build_info['jobName'] = job_name
+                    return build_info
+        return None
+
     def get_latest_builds(self, limit=20):
         """
         Get information about the latest builds across all jobs.
@@ -566,40 +765,211 @@ class JenkinsConnector:
         :return: List of latest builds or empty list if request fails
         """
         try:
-            # Get list of all jobs first
-            all_jobs = self.list_jobs()
+            # Fetch the last build of every job in a single filtered request
+            # instead of 2 round-trips per job (job info + build info)
+            info = self.get_jenkins_info('/api/json', params={
+                'tree': 'jobs[name,lastBuild[number,timestamp,result,url,displayName,fullDisplayName,duration,building]]'
+            })
+
             all_builds = []
+            if info and 'jobs' in info:
+                for job in info['jobs']:
+                    last_build = job.get('lastBuild')
+                    if last_build:
+                        # Add job name to the build info for reference
+                        last_build['jobName'] = job.get('name', 'Unknown')
+                        all_builds.append(last_build)
+
+            if not all_builds:
+                # Fallback: fan the per-job fetches out over the pooled session
+                # in parallel when the batched tree query returned nothing
+                all_jobs = self.list_jobs()
+                if all_jobs:
+                    max_workers = min(len(all_jobs), self.pool_size)
+                    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                        futures = {
+                            executor.submit(self._fetch_last_build, job_name): job_name
+                            for job_name in all_jobs
+                        }
+                        for future in as_completed(futures):
+                            try:
+                                build_info = future.result()
+                            except Exception as e:
+                                logger.warning(f"Error getting build info for job {futures[future]}: {e}")
+                                continue
+                            if build_info:
+                                all_builds.append(build_info)
 
-            # For each job, get the last build
-            for job_name in all_jobs:
-                try:
-                    # Get job info to find the last build
-                    job_info = self.get_job_info(job_name)
+            # Pick the newest builds; O(N log limit) beats a full sort
+            return heapq.nlargest(limit, all_builds, key=lambda x: x.get('timestamp', 0))
 
-                    if job_info and 'lastBuild' in job_info and job_info['lastBuild']:
-                        last_build_number = job_info['lastBuild'].get('number')
+        except Exception as e:
+            logger.error(f'Failed to get latest builds: {e}')
+            return []
 
-                        if last_build_number:
-                            # Get detailed build info
-                            build_info = self.get_build_info(job_name, last_build_number)
+class AsyncJenkinsConnector:
+    """
+    Asynchronous Jenkins connector built on httpx for high-fanout polling.
 
-                            if build_info:
-                                # Add job name to the build info for reference
-                                build_info['jobName'] = job_name
-                                all_builds.append(build_info)
-                except Exception as e:
-                    logger.warning(f"Error getting build info for job {job_name}: {e}")
-                    continue
+    All in-flight requests share a small keep-alive connection pool, so
+    polling many endpoints concurrently doesn't cost a thread per request.
+    Requires the optional httpx dependency (pip install httpx).
+    """
 
-            # Sort builds by timestamp (newest first) and limit the result
-            sorted_builds = sorted(all_builds, key=lambda x: x.get('timestamp', 0), reverse=True)
-            return sorted_builds[:limit]
+    def __init__(self, jenkins_url, username=None, api_token=None, verify_ssl=False, timeout=30):
+        """
+        Initialize the async Jenkins connection.
+
+        :param jenkins_url: Base URL of Jenkins server
+        :param username: Jenkins username (optional, can use environment variable)
+        :param api_token: Jenkins API token (optional, can use environment variable)
+        :param verify_ssl: Whether to verify SSL certificates (default: False)
+        :param timeout: Connection timeout in seconds (default: 30)
+        """
+        if httpx is None:
+            raise ImportError(
+                "httpx is required for AsyncJenkinsConnector. "
+                "Install it with: pip install httpx"
+            )
+
+        self.jenkins_url = jenkins_url.rstrip('/')
+        self.username = username or os.environ.get('JENKINS_USERNAME')
+        self.api_token = api_token or os.environ.get('JENKINS_API_TOKEN')
+
+        # Validate credentials
+        if not self.username or not self.api_token:
+            raise JenkinsAuthenticationError(
+                "Missing credentials. "
+                "Please provide username and API token either as arguments or as environment variables."
+            )
+
+        self.timeout = timeout
+
+        client_kwargs = {
+            'base_url': self.jenkins_url,
+            'auth': (self.username, self.api_token),
+            'verify': verify_ssl,
+            'timeout': timeout,
+            'headers': {'Accept': 'application/json'},
+            'limits': httpx.Limits(max_keepalive_connections=32, max_connections=64),
+        }
+        try:
+            # HTTP/2 multiplexing when the h2 package is installed
+            self.client = httpx.AsyncClient(http2=True, **client_kwargs)
+        except ImportError:
+            self.client = httpx.AsyncClient(**client_kwargs)
+
+    async def aclose(self):
+        """
+        Close the underlying HTTP client and its connections.
+        """
+        await self.client.aclose()
+
+    async def get_jenkins_info(self, endpoint='/api/json', params=None):
+        """
+        Retrieve Jenkins information with authentication handling.
+
+        :param endpoint: API endpoint to query
+        :param params: Additional URL parameters (dict)
+        :return: JSON response or response text for non-JSON replies
+        """
+        try:
+            response = await self.client.get(endpoint, params=params)
+            response.raise_for_status()
+
+            content_type = response.headers.get('Content-Type', '')
+            if 'application/json' in content_type or 'text/json' in content_type:
+                return _loads(response.content)
+            logger.warning(f"Response is not JSON. Content-Type: {content_type}")
+            return response.text
+
+        except httpx.HTTPStatusError as e:
+            if e.response.status_code == 401:
+                logger.error("Unauthorized: Check your Jenkins credentials")
+                raise JenkinsAuthenticationError(
+                    "Unauthorized access. Verify username and API token."
+                ) from e
+            elif e.response.status_code == 403:
+                logger.error("Forbidden: Insufficient permissions")
+                raise JenkinsAuthenticationError(
+                    "Access forbidden. Check user permissions in Jenkins."
+                ) from e
+            logger.error(f"HTTP error occurred: {e}")
+            raise
+
+        except httpx.HTTPError as e:
+            logger.error(f"Request failed: {e}")
+            raise
+
+    async def list_jobs(self):
+        """
+        List all jobs on the Jenkins server.
+
+        :return: List of job names or empty list if request fails
+        """
+        info = await self.get_jenkins_info()
+        if info and 'jobs' in info:
+            return [job['name'] for job in info['jobs']]
+        return []
+
+    async def _fetch_last_build(self, job_name):
+        """
+        Fetch detailed information about the last build of a single job.
+
+        :param job_name: Name of the job
+        :return: Build information dict (with jobName added) or None
+        """
+        encoded_job_name = _quote_job(job_name)
+        job_info = await self.get_jenkins_info(f'/job/{encoded_job_name}/api/json')
+
+        if job_info and job_info.get('lastBuild'):
+            last_build_number = job_info['lastBuild'].get('number')
+            if last_build_number:
+                build_info = await self.get_jenkins_info(
+                    f'/job/{encoded_job_name}/{last_build_number}/api/json'
+                )
+                if build_info:
+                    build_info['jobName'] = job_name
+                    return build_info
+        return None
+
+    async def get_latest_builds(self, limit=20):
+        """
+        Get information about the latest builds across all jobs.
+
+        All per-job fetches run concurrently on the shared client.
+
+        :param limit: Maximum number of builds to return
+        :return: List of latest builds or empty list if request fails
+        """
+        try:
+            all_jobs = await self.list_jobs()
+            results = await asyncio.gather(
+                *(self._fetch_last_build(job_name) for job_name in all_jobs),
+                return_exceptions=True
+            )
+
+            all_builds = []
+            for job_name, result in zip(all_jobs, results):
+                if isinstance(result, Exception):
+                    logger.warning(f"Error getting build info for job {job_name}: {result}")
+                elif result:
+                    all_builds.append(result)
+
+            return heapq.nlargest(limit, all_builds, key=lambda x: x.get('timestamp', 0))
 
         except Exception as e:
             logger.error(f'Failed to get latest builds: {e}')
             return []
 
+
 def main():
+    # Configure logging for the standalone CLI run
+    logging.basicConfig(
+        level=logging.INFO,
+        format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+    )
+
     # Load environment variables from .env file
     load_dotenv()
 
@@ -1,30 +1,65 @@
 # jenkins_connector.py
 
+import asyncio
 import requests
 import base64
 import logging
 import os
 import urllib.parse
 import urllib3
+from collections import OrderedDict
 from requests.auth import HTTPBasicAuth
 from requests.exceptions import RequestException, HTTPError, ConnectionError, Timeout
 from requests.adapters import HTTPAdapter
 from urllib3.util.retry import Retry
 
+# orjson decodes large Jenkins payloads several times faster than the stdlib;
+# fall back silently when it is not installed
+try:
+    import orjson
+
+    def _loads(data):
+        return orjson.loads(data)
+except ImportError:
+    import json as _json
+
+    def _loads(data):
+        return _json.loads(data)
+
+# httpx powers the optional async connector; the sync connector works without it
+try:
+    import httpx
+except ImportError:
+    httpx = None
+
 # Suppress insecure request warnings
 urllib3.disable_warnings(urllib3.exceptions.InsecureRequestWarning)
 
-# Configure logging
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
-)
+# Logging configuration is left to the importing application
 logger = logging.getLogger(__name__)
 
+# Upper bound on cached responses; distinct per-build endpoints would
+# otherwise accumulate payloads for the life of a long-running process
+_CACHE_MAX = 512
+
 class JenkinsAuthenticationError(Exception):
     """Custom exception for Jenkins authentication issues"""
     pass
 
+
+# Explicit field projections: every field listed is consumed downstream, and
+# Jenkins only serializes what the tree names, so the fat default payloads
+# never cross the wire
+_EXECUTABLE_FIELDS = ('currentExecutable[url,fullDisplayName,displayName,timestamp,'
+                      'estimatedDuration,number,building,result,id,'
+                      'job[name,fullName,displayName],'
+                      'actions[parameters[name,value],causes[shortDescription]]]')
+_RUNNING_BUILDS_TREE = (f'computer[executors[{_EXECUTABLE_FIELDS}],'
+                        f'oneOffExecutors[{_EXECUTABLE_FIELDS}]]')
+_BUILD_INFO_TREE = ('id,number,url,timestamp,estimatedDuration,duration,result,'
+                    'building,fullDisplayName,displayName,'
+                    'actions[parameters[name,value],causes[shortDescription]]')
+
 class JenkinsConnector:
     def __init__(self, jenkins_url=None, username=None, api_token=None, verify_ssl=None, timeout=60):
         """
@@ -118,6 +153,12 @@ class JenkinsConnector:
         # Crumb data will be obtained when needed
         self.crumb = None
 
+        # Conditional-request cache keyed by (endpoint, params): the ETag /
+        # Last-Modified validators plus the last decoded payload, so an
+        # unchanged endpoint answers 304 with no body to parse. LRU-bounded
+        # so distinct per-build endpoints can't grow it without limit
+        self._cache = OrderedDict()
+
     def refresh_connection(self):
         """
         Refresh the connection to Jenkins server.
@@ -149,8 +190,9 @@ class JenkinsConnector:
             self.session.mount("http://", adapter)
             self.session.mount("https://", adapter)
 
-            # Reset crumb
+            # Reset crumb and cached payloads
             self.crumb = None
+            self._cache = OrderedDict()
 
             # Test the new connection
             return self.test_connection()
@@ -286,16 +328,26 @@ class JenkinsConnector:
         if params is None:
             params = {}
 
+        cache_key = (endpoint, frozenset(params.items()))
+        cached = self._cache.get(cache_key)
+
         full_url = f'{self.jenkins_url}{endpoint}'
 
         try:
-            # Attempt connection
+            # Attempt connection, revalidating any previously cached payload
             response = self.session.get(
                 full_url,
                 params=params,
-                timeout=timeout
+                timeout=timeout,
+                headers=cached['cond'] if cached else None
             )
 
+            # Nothing changed on the server - reuse the cached payload
+            if response.status_code == 304 and cached:
+                logger.debug("Not modified, serving cached data for %s", endpoint)
+                self._cache.move_to_end(cache_key)
+                return cached['payload']
+
             # Raise an exception for bad HTTP responses
             response.raise_for_status()
 
@@ -305,7 +357,21 @@ class JenkinsConnector:
             # Check if the response is JSON
             content_type = response.headers.get('Content-Type', '')
             if 'application/json' in content_type or 'text/json' in content_type:
-                return response.json()
+                result = _loads(response.content)
+
+                # Remember the validators so the next poll can be conditional
+                cond = {}
+                if response.headers.get('ETag'):
+                    cond['If-None-Match'] = response.headers['ETag']
+                if response.headers.get('Last-Modified'):
+                    cond['If-Modified-Since'] = response.headers['Last-Modified']
+                if cond:
+                    self._cache[cache_key] = {'cond': cond, 'payload': result}
+                    self._cache.move_to_end(cache_key)
+                    if len(self._cache) > _CACHE_MAX:
+                        self._cache.popitem(last=False)
+
+                return result
             else:
                 logger.warning(f"Response is not JSON. Content-Type: {content_type}")
                 return response.text
@@ -377,7 +443,7 @@ class JenkinsConnector:
             # Check if response is JSON, if so return it
             content_type = response.headers.get('Content-Type', '')
             if 'application/json' in content_type or 'text/json' in content_type:
-                return response.json()
+                return _loads(response.content)
             return response
 
         except HTTPError as e:
@@ -401,7 +467,7 @@ class JenkinsConnector:
 
                     content_type = response.headers.get('Content-Type', '')
                     if 'application/json' in content_type or 'text/json' in content_type:
-                        return response.json()
+                        return _loads(response.content)
                     return response
 
                 except HTTPError as retry_e:
@@ -460,15 +526,17 @@ class JenkinsConnector:
         :return: List of running builds or empty list if request fails
         """
         try:
-            # Using deeper tree and more specific fields to get all name information
+            # The explicit tree projection makes depth=1 sufficient and keeps
+            # the response to the fields the dashboard actually formats
             params = {
-                'depth': 2,
-                'tree': 'computer[executors[currentExecutable[*,url,fullDisplayName,displayName,description,timestamp,estimatedDuration,number,building,result,job[*]]],oneOffExecutors[currentExecutable[*,url,fullDisplayName,displayName,description,timestamp,estimatedDuration,number,building,result,job[*]]]]'
+                'depth': 1,
+                'tree': _RUNNING_BUILDS_TREE
             }
             computer_info = self.get_jenkins_info('/computer/api/json', params=params)
 
             running_builds = []
             seen_builds = set()  # Track builds we've already added by URL
+            debug_enabled = logger.isEnabledFor(logging.DEBUG)
 
             if computer_info and 'computer' in computer_info:
                 for node in computer_info['computer']:
@@ -481,7 +549,8 @@ class JenkinsConnector:
                                 build_url = build.get('url')
                                 if build_url and build_url not in seen_builds:
                                     # Print full build info for debugging
-                                    logger.debug(f"Build info: {build}")
+                                    if debug_enabled:
+                                        logger.debug("Build info: %s", build)
 
                                     # Enhance build info with job name
                                     if 'job' in build and 'name' in build['job']:
@@ -498,7 +567,8 @@ class JenkinsConnector:
                                         build['displayName'] = f"#{build.get('number', 'N/A')}"
 
                                     # Log the display name for debugging
-                                    logger.info(f"Build display name: {build.get('displayName', 'N/A')}")
+                                    if debug_enabled:
+                                        logger.debug("Build display name: %s", build.get('displayName', 'N/A'))
 
                                     running_builds.append(build)
                                     seen_builds.add(build_url)
@@ -512,7 +582,8 @@ class JenkinsConnector:
                                 build_url = build.get('url')
                                 if build_url and build_url not in seen_builds:
                                     # Print full build info for debugging
-                                    logger.debug(f"Build info: {build}")
+                                    if debug_enabled:
+                                        logger.debug("Build info: %s", build)
 
                                     # Enhance build info with job name
                                     if 'job' in build and 'name' in build['job']:
@@ -529,15 +600,16 @@ class JenkinsConnector:
                                         build['displayName'] = f"#{build.get('number', 'N/A')}"
 
                                     # Log the display name for debugging
-                                    logger.info(f"Build display name: {build.get('displayName', 'N/A')}")
+                                    if debug_enabled:
+                                        logger.debug("Build display name: %s", build.get('displayName', 'N/A'))
 
                                     running_builds.append(build)
                                     seen_builds.add(build_url)
 
-                # Additional logging for debugging
                 logger.info(f"Total running builds: {len(running_builds)}")
-                for build in running_builds:
-                    logger.info(f"Job: {build.get('jobName', 'Unknown')}, Display: {build.get('displayName', 'Unknown')}")
+                if debug_enabled:
+                    for build in running_builds:
+                        logger.debug("Job: %s, Display: %s", build.get('jobName', 'Unknown'), build.get('displayName', 'Unknown'))
 
                 return running_builds
         except Exception as e:
@@ -559,8 +631,9 @@ class JenkinsConnector:
             # For each job, get the last build
             for job_name in all_jobs:
                 try:
-                    # Get job info to find the last build
-                    job_info = self.get_job_info(job_name)
+                    # Get job info to find the last build; only the build
+                    # number is needed here
+                    job_info = self.get_job_info(job_name, tree='lastBuild[number]')
 
                     if job_info and 'lastBuild' in job_info and job_info['lastBuild']:
                         last_build_number = job_info['lastBuild'].get('number')
@@ -609,22 +682,26 @@ class JenkinsConnector:
 
             # Use a shorter timeout for build info requests
             shorter_timeout = min(10, self.timeout)
-            return self.get_jenkins_info(endpoint, timeout=shorter_timeout)
+            return self.get_jenkins_info(
+                endpoint, timeout=shorter_timeout, params={'tree': _BUILD_INFO_TREE}
+            )
         except Exception as e:
             logger.error(f'Failed to get build info for {job_name} #{build_number}: {e}')
             return None
 
-    def get_job_info(self, job_name):
+    def get_job_info(self, job_name, tree=None):
         """
         Get detailed information about a specific job.
 
         :param job_name: Name of the job
+        :param tree: Optional tree filter restricting the returned fields
         :return: Job information dict or None if request fails
         """
         try:
             encoded_job_name = urllib.parse.quote(job_name)
             endpoint = f'/job/{encoded_job_name}/api/json'
-            return self.get_jenkins_info(endpoint)
+            params = {'tree': tree} if tree else None
+            return self.get_jenkins_info(endpoint, params=params)
         except Exception as e:
             logger.error(f'Failed to get job info for {job_name}: {e}')
             return None
@@ -651,4 +728,173 @@ class JenkinsConnector:
                 return self.post_to_jenkins(endpoint)
         except Exception as e:
             logger.error(f'Failed to build job {job_name}: {e}')
-            return None
\ No newline at end of file
+            return None
+
+class AsyncJenkinsConnector:
+    """
+    Asynchronous Jenkins connector built on httpx for high-fanout polling.
+
+    All in-flight requests share a small keep-alive connection pool, so the
+    running/queued/latest fetches can be issued with asyncio.gather without
+    costing a thread per request. Requires the optional httpx dependency
+    (pip install httpx).
+    """
+
+    def __init__(self, jenkins_url=None, username=None, api_token=None, verify_ssl=False, timeout=60):
+        """
+        Initialize the async Jenkins connection.
+
+        :param jenkins_url: Base URL of Jenkins server
+        :param username: Jenkins username (optional, can use environment variable)
+        :param api_token: Jenkins API token (optional, can use environment variable)
+        :param verify_ssl: Whether to verify SSL certificates (default: False)
+        :param timeout: Connection timeout in seconds (default: 60)
+        """
+        if httpx is None:
+            raise ImportError(
+                "httpx is required for AsyncJenkinsConnector. "
+                "Install it with: pip install httpx"
+            )
+
+        self.jenkins_url = (jenkins_url or os.environ.get('JENKINS_URL', '')).rstrip('/')
+        self.username = username or os.environ.get('JENKINS_USERNAME')
+        self.api_token = api_token or os.environ.get('JENKINS_API_TOKEN')
+
+        # Validate credentials
+        if not self.username or not self.api_token:
+            raise JenkinsAuthenticationError(
+                "Missing credentials. "
+                "Please provide username and API token either as arguments or as environment variables."
+            )
+
+        self.timeout = timeout
+
+        client_kwargs = {
+            'base_url': self.jenkins_url,
+            'auth': (self.username, self.api_token),
+            'verify': verify_ssl,
+            'timeout': timeout,
+            'headers': {'Accept': 'application/json'},
+            'limits': httpx.Limits(max_keepalive_connections=8, max_connections=32),
+        }
+        try:
+            # HTTP/2 multiplexing when the h2 package is installed
+            self.client = httpx.AsyncClient(http2=True, **client_kwargs)
+        except ImportError:
+            self.client = httpx.AsyncClient(**client_kwargs)
+
+    async def aclose(self):
+        """
+        Close the underlying HTTP client and its connections.
+        """
+        await self.client.aclose()
+
+    async def get_jenkins_info(self, endpoint='/api/json', params=None):
+        """
+        Retrieve Jenkins information with authentication handling.
+
+        :param endpoint: API endpoint to query
+        :param params: Additional URL parameters (dict)
+        :return: JSON response or response text for non-JSON replies
+        """
+        try:
+            response = await self.client.get(endpoint, params=params)
+            response.raise_for_status()
+
+            content_type = response.headers.get('Content-Type', '')
+            if 'application/json' in content_type or 'text/json' in content_type:
+                return _loads(response.content)
+            logger.warning(f"Response is not JSON. Content-Type: {content_type}")
+            return response.text
+
+        except httpx.HTTPStatusError as e:
+            if e.response.status_code == 401:
+                logger.error("Unauthorized: Check your Jenkins credentials")
+                raise JenkinsAuthenticationError(
+                    "Unauthorized access. Verify username and API token."
+                ) from e
+            elif e.response.status_code == 403:
+                logger.error("Forbidden: Insufficient permissions")
+                raise JenkinsAuthenticationError(
+                    "Access forbidden. Check user permissions in Jenkins."
+                ) from e
+            logger.error(f"HTTP error occurred: {e}")
+            raise
+
+        except httpx.HTTPError as e:
+            logger.error(f"Request failed: {e}")
+            raise
+
+    async def list_jobs(self):
+        """
+        List all jobs on the Jenkins server.
+
+        :return: List of job names or empty list if request fails
+        """
+        info = await self.get_jenkins_info()
+        if info and 'jobs' in info:
+            return [job['name'] for job in info['jobs']]
+        return []
+
+    async def get_build_queue(self):
+        """
+        Get information about builds in the queue.
+
+        :return: List of queued builds or empty list if request fails
+        """
+        queue_info = await self.get_jenkins_info('/queue/api/json')
+        if queue_info and 'items' in queue_info:
+            return queue_info['items']
+        return []
+
+    async def _fetch_last_build(self, job_name):
+        """
+        Fetch detailed information about the last build of a single job.
+
+        :param job_name: Name of the job
+        :return: Build information dict (with jobName added) or None
+        """
+        encoded_job_name = urllib.parse.quote(job_name)
+        job_info = await self.get_jenkins_info(f'/job/{encoded_job_name}/api/json')
+
+        if job_info and job_info.get('lastBuild'):
+            last_build_number = job_info['lastBuild'].get('number')
+            if last_build_number:
+                build_info = await self.get_jenkins_info(
+                    f'/job/{encoded_job_name}/{last_build_number}/api/json'
+                )
+                if build_info:
+                    build_info['jobName'] = job_name
+                    return build_info
+        return None
+
+    async def get_latest_builds(self, limit=20):
+        """
+        Get information about the latest builds across all jobs.
+
+        All per-job fetches run concurrently on the shared client.
+
+        :param limit: Maximum number of builds to return
+        :return: List of latest builds or empty list if request fails
+        """
+        try:
+            all_jobs = await self.list_jobs()
+            results = await asyncio.gather(
+                *(self._fetch_last_build(job_name) for job_name in all_jobs),
+                return_exceptions=True
+            )
+
+            all_builds = []
+            for job_name, result in zip(all_jobs, results):
+                if isinstance(result, Exception):
+                    logger.warning(f"Error getting build info for job {job_name}: {result}")
+                elif result:
+                    all_builds.append(result)
+
+            # Sort builds by timestamp (newest first) and limit the result
+            sorted_builds = sorted(all_builds, key=lambda x: x.get('timestamp', 0), reverse=True)
+            return sorted_builds[:limit]
+
+        except Exception as e:
+            logger.error(f'Failed to get latest builds: {e}')
+            return []
@@ -1,14 +1,18 @@
 # jenkins_dashboard_cli.py
 
 import os
+import json
 import time
 import curses
 import logging
+import functools
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from dotenv import load_dotenv
 
 # Import the JenkinsConnector from your module
 from jenkins_connector import JenkinsConnector, JenkinsAuthenticationError
+from jenkins_formatters import job_name_from_build, build_display_name
 
 # Configure logging
 logging.basicConfig(
@@ -18,6 +22,9 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Queue field projection: exactly what _get_queue_info reads, built once
+_QUEUE_TREE = 'items[id,why,inQueueSince,task[name]]'
+
 class JenkinsDashboardCLI:
     def __init__(self, jenkins_connector):
         """
@@ -28,6 +35,9 @@ class JenkinsDashboardCLI:
         self.connector = jenkins_connector
         self.refresh_interval = 10  # seconds
 
+        # Small pool so the independent Jenkins fetches overlap their latency
+        self._fetch_pool = ThreadPoolExecutor(max_workers=2, thread_name_prefix='jenkins-fetch')
+
         # Define column positions and widths
         self.columns = {
             'job_name': {'start': 0, 'width': 200, 'title': "JOB NAME"},
@@ -36,126 +46,69 @@ class JenkinsDashboardCLI:
             'remaining': {'start': 120, 'width': 15, 'title': "REMAINING"}
         }
 
-    def _format_time_remaining(self, build):
+    def _format_time_remaining(self, build, now_ms):
         """
         Format the estimated time remaining for a build.
 
         :param build: Build information dictionary
+        :param now_ms: Current time in milliseconds (Jenkins uses milliseconds)
         :return: Formatted time string
         """
         if 'estimatedDuration' not in build or 'timestamp' not in build:
             return "Unknown"
 
-        # Calculate time elapsed and estimated total time
-        current_time = int(time.time() * 1000)  # Jenkins uses milliseconds
-        time_elapsed = current_time - build['timestamp']
-
         # If estimated duration is 0, we can't make a prediction
         if build['estimatedDuration'] == 0:
             return "Unknown"
 
         # Calculate remaining time
-        time_remaining = build['estimatedDuration'] - time_elapsed
+        time_remaining = build['estimatedDuration'] - (now_ms - build['timestamp'])
 
         # If already past estimated time
         if time_remaining <= 0:
             return "Overdue"
 
-        # Convert to minutes and seconds
-        minutes = int(time_remaining / 60000)
-        seconds = int((time_remaining % 60000) / 1000)
+        # Convert to minutes and seconds in integer arithmetic
+        minutes, seconds = divmod(time_remaining // 1000, 60)
 
         return f"{minutes}m {seconds}s"
 
-    def _get_job_name_from_url(self, url):
-        """
-        Extract the job name from a Jenkins URL.
-
-        :param url: Jenkins URL for the job
-        :return: Job name
-        """
-        if not url:
-            return "Unknown"
-
-        # Remove trailing slash if present
-        if url.endswith('/'):
-            url = url[:-1]
-
-        # Get the last part of the URL
-        job_parts = url.split('/')
-
-        # The job name is typically the last part after 'job'
-        for i, part in enumerate(job_parts):
-            if part == 'job' and i + 1 < len(job_parts):
-                return job_parts[i + 1]
-
-        # If we can't determine the job name, return the last part
-        return job_parts[-1]
-
-    def _get_build_info(self, build):
+    def _get_build_info(self, build, now_ms):
         """
         Extract relevant information from a build.
 
         :param build: Build information dictionary
+        :param now_ms: Current time in milliseconds
         :return: Dictionary with formatted build information
         """
-        # Log available fields for debugging
-        logger.debug(f"Build fields: {list(build.keys())}")
+        # Bind the method once; saves a dict-method lookup per access in
+        # this per-build hot path
+        _get = build.get
+
+        # Log available fields for debugging; guard so the key list is not
+        # even built when DEBUG is off
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Build fields: %s", list(build.keys()))
 
         # First, determine the job name (for the JOB NAME column)
-        if 'jobName' in build:
-            job_name = build['jobName']
-        elif 'jobFullName' in build:
-            job_name = build['jobFullName']
-        elif 'jobDisplayName' in build:
-            job_name = build['jobDisplayName']
-        elif 'job' in build and 'name' in build['job']:
-            job_name = build['job']['name']
-        elif 'job' in build and 'fullName' in build['job']:
-            job_name = build['job']['fullName']
-        else:
-            # Fall back to URL parsing if job name not available
-            job_name = self._get_job_name_from_url(build.get('url', ''))
+        job_name = job_name_from_build(build)
 
         # Now, determine the build display name (for the BUILD column)
-        # This should be different from the job name and include build-specific information
-        build_number = build.get('number', 'N/A')
-
-        # Try different fields for display name in order of preference
-        if 'fullDisplayName' in build and build['fullDisplayName']:
-            # Extract just the build-specific part if possible
-            full_display = build['fullDisplayName']
-
-            # If the full display starts with the job name, try to extract just the build part
-            if full_display.startswith(job_name):
-                build_display = full_display[len(job_name):].strip()
-            else:
-                build_display = full_display
-        elif 'displayName' in build and build['displayName']:
-            build_display = build['displayName']
-        else:
-            # Fall back to just the build number
-            build_display = f"#{build_number}"
-
-        # If the build display is empty or just whitespace, use the build number
-        if not build_display or build_display.isspace():
-            build_display = f"#{build_number}"
-
-        # If build display doesn't start with #, add it for clarity
-        if not build_display.startswith('#'):
-            build_display = f"#{build_number} - {build_display}"
+        build_number = _get('number', 'N/A')
+        build_display = build_display_name(build, job_name)
 
         # Log what we've determined
-        logger.info(f"JOB NAME: {job_name}")
-        logger.info(f"BUILD DISPLAY: {build_display}")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("JOB NAME: %s", job_name)
+            logger.debug("BUILD DISPLAY: %s", build_display)
 
         return {
             'job_name': job_name,
             'build_number': build_number,
             'build_display': build_display,
-            'duration': f"{build.get('estimatedDuration', 0) / 60000:.1f}m",
-            'progress': self._format_time_remaining(build),
-            'url': build.get('url', '')
+            'duration': f"{_get('estimatedDuration', 0) / 60000:.1f}m",
+            'progress': self._format_time_remaining(build, now_ms),
+            'url': _get('url', '')
         }
     def _get_queue_info(self, queue_item):
         """
@@ -164,16 +117,19 @@ class JenkinsDashboardCLI:
         :param queue_item: Queue item information dictionary
         :return: Dictionary with formatted queue information
         """
+        _get = queue_item.get
+
         job_name = "Unknown"
-        if 'task' in queue_item and 'name' in queue_item['task']:
-            job_name = queue_item['task']['name']
+        task = _get('task')
+        if task and 'name' in task:
+            job_name = task['name']
 
-        why = queue_item.get('why', 'Unknown reason')
+        why = _get('why', 'Unknown reason')
 
         # Get when the item was queued
         queued_time = "Unknown"
-        if 'inQueueSince' in queue_item:
-            queue_time_ms = queue_item['inQueueSince']
+        queue_time_ms = _get('inQueueSince')
+        if queue_time_ms is not None:
             queue_datetime = datetime.fromtimestamp(queue_time_ms / 1000)
             queued_time = queue_datetime.strftime('%H:%M:%S')
 
@@ -181,7 +137,7 @@ class JenkinsDashboardCLI:
             'job_name': job_name,
             'why': why,
             'queued_since': queued_time,
-            'id': queue_item.get('id', 'N/A')
+            'id': _get('id', 'N/A')
         }
 
     def get_dashboard_data(self):
@@ -190,19 +146,33 @@ class JenkinsDashboardCLI:
 
         :return: Dictionary with running builds and queue information
         """
-        try:
-            # Get running builds
-            running_builds = self.connector.get_running_builds()
-            formatted_builds = [self._get_build_info(build) for build in running_builds]
+        # One timestamp per refresh, shared by the success and error branches
+        now_str = time.strftime('%Y-%m-%d %H:%M:%S')
 
-            # Get queued builds
-            queued_builds = self.connector.get_build_queue()
-            formatted_queue = [self._get_queue_info(item) for item in queued_builds]
+        try:
+            # Issue both independent fetches concurrently so a refresh
+            # takes max(t1, t2) instead of t1 + t2
+            future_running = self._fetch_pool.submit(self.connector.get_running_builds)
+            future_queue = self._fetch_pool.submit(self.connector.get_build_queue, tree=_QUEUE_TREE)
+
+            # Get running builds; sample the clock once for the whole batch
+            # and fill a pre-sized list rather than growing one
+            running_builds = future_running.result()
+            now_ms = int(time.time() * 1000)
+            formatted_builds = [None] * len(running_builds)
+            for i, build in enumerate(running_builds):
+                formatted_builds[i] = self._get_build_info(build, now_ms)
+
+            # Get queued builds, fetching only the fields we format
+            queued_builds = future_queue.result()
+            formatted_queue = [None] * len(queued_builds)
+            for i, item in enumerate(queued_builds):
+                formatted_queue[i] = self._get_queue_info(item)
 
             return {
                 'running_builds': formatted_builds,
                 'queued_builds': formatted_queue,
-                'timestamp': datetime.now().strftime('%Y-%m-%d %H:%M:%S'),
+                'timestamp': now_str,
                 'error': None
             }
         except Exception as e:
@@ -210,7 +180,7 @@ class JenkinsDashboardCLI:
             return {
                 'running_builds': [],
                 'queued_builds': [],
-                'timestamp': datetime.now().strftime('%Y-%m-%d %H:%M:%S'),
+                'timestamp': now_str,
                 'error': str(e)
             }
 
@@ -243,10 +213,15 @@ class JenkinsDashboardCLI:
             # Silently handle any curses errors
             pass
 
-    def _format_column_text(self, text, width):
+    @staticmethod
+    @functools.lru_cache(maxsize=512)
+    def _format_column_text(text, width):
         """
         Format text to fit within a column with proper truncation.
 
+        Cached because the same (text, width) pairs recur on every render
+        tick; job names rarely change between frames.
+
         :param text: Text to format
         :param width: Column width
         :return: Formatted text
@@ -266,7 +241,7 @@ class JenkinsDashboardCLI:
         curses.curs_set(0)  # Hide cursor
         curses.use_default_colors()  # Use terminal's default colors
         stdscr.nodelay(1)  # Non-blocking input
-        stdscr.timeout(100)  # Check for input every 100ms
+        stdscr.timeout(500)  # getch() blocks up to 500ms, pacing the loop
 
         # Color pairs
         curses.init_pair(1, curses.COLOR_GREEN, -1)  # Green for running
@@ -274,18 +249,27 @@ class JenkinsDashboardCLI:
         curses.init_pair(3, curses.COLOR_RED, -1)  # Red for error
         curses.init_pair(4, curses.COLOR_CYAN, -1)  # Cyan for headers
 
+        # Off-screen pad the frame is composed into; one noutrefresh/doupdate
+        # per loop pass flushes it without visible tearing. Sized to the
+        # terminal (plus one row/col so writes to the last cell don't clip)
+        # and re-allocated whenever the terminal is resized
+        max_y, max_x = stdscr.getmaxyx()
+        pad = curses.newpad(max_y + 1, max_x + 1)
+
         running = True
         last_refresh = 0
+        last_data_key = None
+        last_footer = None
         data = {
             'running_builds': [],
             'queued_builds': [],
-            'timestamp': datetime.now().strftime('%Y-%m-%d %H:%M:%S'),
+            'timestamp': time.strftime('%Y-%m-%d %H:%M:%S'),
             'error': None
         }
 
         while running:
             try:
-                current_time = time.time()
+                current_time = time.monotonic()
 
                 # Check for key presses
                 key = stdscr.getch()
@@ -294,6 +278,11 @@ class JenkinsDashboardCLI:
                     break
                 elif key == ord('r'):
                     last_refresh = 0  # Force refresh
+                elif key == curses.KEY_RESIZE:
+                    # Re-allocate the pad to match the new terminal size
+                    max_y, max_x = stdscr.getmaxyx()
+                    pad = curses.newpad(max_y + 1, max_x + 1)
+                    last_data_key = None  # Force redraw at the new size
 
                 # Refresh data if needed
                 if current_time - last_refresh >= self.refresh_interval:
@@ -303,30 +292,39 @@ class JenkinsDashboardCLI:
                     except Exception as e:
                         logger.error(f"Failed to refresh data: {e}")
                         data['error'] = str(e)
-                        data['timestamp'] = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+                        data['timestamp'] = time.strftime('%Y-%m-%d %H:%M:%S')
+
+                # Skip the redraw entirely when neither the data nor the
+                # footer countdown changed since the last pass
+                data_key = hash(json.dumps(data, sort_keys=True, default=str))
+                footer = f" Running: {len(data.get('running_builds', []))} | Queued: {len(data.get('queued_builds', []))} | Next refresh: {int(self.refresh_interval - (current_time - last_refresh))}s "
+                if data_key == last_data_key and footer == last_footer:
+                    continue
+                last_data_key = data_key
+                last_footer = footer
 
-                # Clear screen
-                stdscr.clear()
+                # Clear the pad without forcing a full repaint
+                pad.erase()
 
                 # Get terminal dimensions
                 max_y, max_x = stdscr.getmaxyx()
 
                 # Draw header
                 header = f" JENKINS BUILD DASHBOARD | {data['timestamp']} | Press 'q' to quit, 'r' to refresh "
-                self._safe_addstr(stdscr, 0, 0, header[:max_x-1], curses.A_REVERSE)
+                self._safe_addstr(pad, 0, 0, header[:max_x-1], curses.A_REVERSE)
 
                 # Draw error message if any
                 if data.get('error'):
                     error_msg = f"ERROR: {data['error']}"
-                    self._safe_addstr(stdscr, 1, 0, error_msg[:max_x-1], curses.color_pair(3))
+                    self._safe_addstr(pad, 1, 0, error_msg[:max_x-1], curses.color_pair(3))
 
                 # Draw running builds section
-                self._safe_addstr(stdscr, 2, 0, "RUNNING BUILDS:", curses.color_pair(4) | curses.A_BOLD)
+                self._safe_addstr(pad, 2, 0, "RUNNING BUILDS:", curses.color_pair(4) | curses.A_BOLD)
 
                 if data.get('running_builds'):
                     # Table header
                     for col_name, col_info in self.columns.items():
-                        self._safe_addstr(stdscr, 3, col_info['start'], col_info['title'], curses.A_UNDERLINE)
+                        self._safe_addstr(pad, 3, col_info['start'], col_info['title'], curses.A_UNDERLINE)
 
                     # Table content
                     max_builds = max_y - 10  # Limit based on terminal height
@@ -335,38 +333,38 @@ class JenkinsDashboardCLI:
 
                         # Job name
                         job_name = self._format_column_text(build['job_name'], self.columns['job_name']['width'])
-                        self._safe_addstr(stdscr, y_pos, self.columns['job_name']['start'], job_name, curses.color_pair(1))
+                        self._safe_addstr(pad, y_pos, self.columns['job_name']['start'], job_name, curses.color_pair(1))
 
                         # Build display name
                         build_display = self._format_column_text(
                             build.get('build_display', f"#{build['build_number']}"),
                             self.columns['build']['width']
                         )
-                        self._safe_addstr(stdscr, y_pos, self.columns['build']['start'], build_display)
+                        self._safe_addstr(pad, y_pos, self.columns['build']['start'], build_display)
 
                         # Duration
-                        self._safe_addstr(stdscr, y_pos, self.columns['duration']['start'], build['duration'])
+                        self._safe_addstr(pad, y_pos, self.columns['duration']['start'], build['duration'])
 
                         # Progress
                         attr = 0
                         if build['progress'] == "Overdue":
                             attr = curses.color_pair(3)
-                        self._safe_addstr(stdscr, y_pos, self.columns['remaining']['start'], build['progress'], attr)
+                        self._safe_addstr(pad, y_pos, self.columns['remaining']['start'], build['progress'], attr)
                 else:
-                    self._safe_addstr(stdscr, 4, 0, "No builds currently running", curses.color_pair(2))
+                    self._safe_addstr(pad, 4, 0, "No builds currently running", curses.color_pair(2))
 
                 # Calculate starting position for queue section
                 queue_start_y = min(max_y - 10, 6 + len(data.get('running_builds', [])))
 
                 # Draw build queue section if there's room
                 if queue_start_y < max_y - 2:
-                    self._safe_addstr(stdscr, queue_start_y, 0, "BUILD QUEUE:", curses.color_pair(4) | curses.A_BOLD)
+                    self._safe_addstr(pad, queue_start_y, 0, "BUILD QUEUE:", curses.color_pair(4) | curses.A_BOLD)
 
                     if data.get('queued_builds'):
                         # Table header for queue
-                        self._safe_addstr(stdscr, queue_start_y + 1, self.columns['job_name']['start'], "JOB NAME", curses.A_UNDERLINE)
-                        self._safe_addstr(stdscr, queue_start_y + 1, self.columns['build']['start'], "QUEUED SINCE", curses.A_UNDERLINE)
-                        self._safe_addstr(stdscr, queue_start_y + 1, self.columns['duration']['start'], "REASON", curses.A_UNDERLINE)
+                        self._safe_addstr(pad, queue_start_y + 1, self.columns['job_name']['start'], "JOB NAME", curses.A_UNDERLINE)
+                        self._safe_addstr(pad, queue_start_y + 1, self.columns['build']['start'], "QUEUED SINCE", curses.A_UNDERLINE)
+                        self._safe_addstr(pad, queue_start_y + 1, self.columns['duration']['start'], "REASON", curses.A_UNDERLINE)
 
                         # Table content
                         max_queue_items = max_y - queue_start_y - 4  # Limit based on remaining space
@@ -375,23 +373,23 @@ class JenkinsDashboardCLI:
 
                             # Job name
                             job_name = self._format_column_text(item['job_name'], self.columns['job_name']['width'])
-                            self._safe_addstr(stdscr, y_pos, self.columns['job_name']['start'], job_name, curses.color_pair(2))
+                            self._safe_addstr(pad, y_pos, self.columns['job_name']['start'], job_name, curses.color_pair(2))
 
                             # Queued since
-                            self._safe_addstr(stdscr, y_pos, self.columns['build']['start'], item['queued_since'])
+                            self._safe_addstr(pad, y_pos, self.columns['build']['start'], item['queued_since'])
 
                             # Reason
                             reason = self._format_column_text(item['why'], max_x - self.columns['duration']['start'] - 1)
-                            self._safe_addstr(stdscr, y_pos, self.columns['duration']['start'], reason)
+                            self._safe_addstr(pad, y_pos, self.columns['duration']['start'], reason)
                     else:
-                        self._safe_addstr(stdscr, queue_start_y + 1, 0, "No builds in queue", curses.color_pair(2))
+                        self._safe_addstr(pad, queue_start_y + 1, 0, "No builds in queue", curses.color_pair(2))
 
                 # Draw footer with stats
-                footer = f" Running: {len(data.get('running_builds', []))} | Queued: {len(data.get('queued_builds', []))} | Next refresh: {int(self.refresh_interval - (current_time - last_refresh))}s "
-                self._safe_addstr(stdscr, max_y-1, 0, footer[:max_x-1], curses.A_REVERSE)
+                self._safe_addstr(pad, max_y-1, 0, footer[:max_x-1], curses.A_REVERSE)
 
-                # Refresh the screen
-                stdscr.refresh()
+                # Flush the composed frame in a single update
+                pad.noutrefresh(0, 0, 0, 0, max_y - 1, max_x - 1)
+                curses.doupdate()
 
             except curses.error as e:
                 # Handle any curses errors
@@ -403,9 +401,6 @@ class JenkinsDashboardCLI:
                 logger.error(f"Error in dashboard loop: {e}")
                 time.sleep(1)  # Pause briefly
 
-            # Sleep to reduce CPU usage
-            time.sleep(0.1)
-
 def main():
     # Load environment variables from .env file
     load_dotenv()
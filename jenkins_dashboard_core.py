@@ -2,15 +2,19 @@
 
 import os
 import json
+import heapq
 import logging
+import operator
+import queue
 import time
 import threading
-from datetime import datetime
+from concurrent.futures import ThreadPoolExecutor
 from flask import Flask, render_template, jsonify
 from dotenv import load_dotenv
 
 # Import the JenkinsConnector from your module
 from jenkins_connector import JenkinsConnector, JenkinsAuthenticationError
+from jenkins_formatters import job_name_from_build, build_display_name
 
 # Configure logging
 logging.basicConfig(
@@ -20,6 +24,22 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Parse .env exactly once, at import; constructing further dashboard
+# instances reads plain os.environ without touching the file again
+load_dotenv()
+_DEFAULT_JENKINS_URL = os.environ.get('JENKINS_URL', 'https://jenkins.example.com')
+
+# Queue field projection: exactly what _get_queue_info reads, built once
+_QUEUE_TREE = 'items[id,why,inQueueSince,task[name]]'
+
+# Minimal projections for the cheap change probe that precedes a full refresh
+_PROBE_TREE = 'jobs[name,lastBuild[number,building]]'
+_QUEUE_PROBE_TREE = 'items[id]'
+
+# More running builds than any dashboard view shows; selecting the top N by
+# progress beats a full sort when Jenkins reports many builds
+_MAX_RUNNING_BUILDS = 50
+
 class JenkinsDashboardData:
     def __init__(self, jenkins_url=None):
         """
@@ -27,142 +47,127 @@ class JenkinsDashboardData:
 
         :param jenkins_url: Optional Jenkins URL, otherwise from environment
         """
-        # Load environment variables
-        load_dotenv()
-
         # Get Jenkins URL from parameter, environment, or use default
-        self.jenkins_url = jenkins_url or os.environ.get('JENKINS_URL', 'https://jenkins.example.com')
+        self.jenkins_url = jenkins_url or _DEFAULT_JENKINS_URL
 
         # Create Jenkins connector
         self.connector = JenkinsConnector(self.jenkins_url)
 
         self.refresh_interval = 30  # seconds
+
+        # Small pool so the independent Jenkins fetches overlap their latency
+        self._fetch_pool = ThreadPoolExecutor(max_workers=2, thread_name_prefix='jenkins-fetch')
+
+        # Snapshot of (job, build) tuples and queue ids from the last refresh,
+        # used to skip the full fetch + formatting when nothing changed
+        self._prev_snapshot = None
+
+        # Static build fields keyed by (url, number); for a given build only
+        # progress/remaining change between refreshes
+        self._build_cache = {}
+
+        # SSE subscribers: each gets a bounded queue that _publish feeds
+        self._subscribers = []
+        self._subscribers_lock = threading.Lock()
         self.dashboard_data = {
             'running_builds': [],
             'queued_builds': [],
-            'timestamp': datetime.now().strftime('%Y-%m-%d %H:%M:%S'),
+            'timestamp': time.strftime('%Y-%m-%d %H:%M:%S'),
             'error': None
         }
+        self._dashboard_json_bytes = json.dumps(self.dashboard_data).encode()
 
         # Start background refresh thread
-        self.stop_thread = False
+        self._stop_event = threading.Event()
         self.data_thread = threading.Thread(target=self._refresh_data_thread)
         self.data_thread.daemon = True
         self.data_thread.start()
 
-    def _get_job_name_from_url(self, url):
+    def _get_build_info(self, build, now_ms):
         """
-        Extract the job name from a Jenkins URL.
+        Extract relevant information from a build.
 
-        :param url: Jenkins URL for the job
-        :return: Job name
+        Static fields (names, duration, url) are cached per (url, number)
+        across refreshes; only progress and remaining time are recomputed.
+
+        :param build: Build information dictionary
+        :param now_ms: Current time in milliseconds
+        :return: Dictionary with formatted build information
+        """
+        key = (build.get('url'), build.get('number'))
+        static = self._build_cache.get(key)
+        if static is None:
+            static = self._static_build_info(build)
+            self._build_cache[key] = static
+
+        info = dict(static)
+        self._apply_progress(build, info, now_ms)
+        return info
+
+    def _static_build_info(self, build):
+        """
+        Compute the refresh-invariant fields of a build's display dict.
+
+        :param build: Build information dictionary
+        :return: Dictionary with the static formatted build information
         """
-        if not url:
-            return "Unknown"
+        # Bind the method once; saves a dict-method lookup per access in
+        # this per-build hot path
+        _get = build.get
 
-        # Remove trailing slash if present
-        if url.endswith('/'):
-            url = url[:-1]
+        # Log available fields for debugging; guard so the key list is not
+        # even built when DEBUG is off
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Build fields: %s", list(build.keys()))
 
-        # Get the last part of the URL
-        job_parts = url.split('/')
+        # First, determine the job name (for the JOB NAME column)
+        job_name = job_name_from_build(build)
+
+        # Now, determine the build display name (for the BUILD column)
+        build_number = _get('number', 'N/A')
+        build_display = build_display_name(build, job_name)
 
-        # The job name is typically the last part after 'job'
-        for i, part in enumerate(job_parts):
-            if part == 'job' and i + 1 < len(job_parts):
-                return job_parts[i + 1]
+        # Log what we've determined
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("JOB NAME: %s", job_name)
+            logger.debug("BUILD DISPLAY: %s", build_display)
 
-        # If we can't determine the job name, return the last part
-        return job_parts[-1]
+        return {
+            'id': _get('id', 'unknown'),
+            'job_name': job_name,
+            'build_number': build_number,
+            'build_display': build_display,
+            'estimated_duration': f"{_get('estimatedDuration', 0) / 60000:.1f}m",
+            'url': _get('url', ''),
+            'timestamp': _get('timestamp', 0)
+        }
 
-    def _get_build_info(self, build):
+    def _apply_progress(self, build, info, now_ms):
         """
-        Extract relevant information from a build.
+        Set the time-varying progress and remaining fields on a build dict.
 
         :param build: Build information dictionary
-        :return: Dictionary with formatted build information
+        :param info: Formatted build dict to update in place
+        :param now_ms: Current time in milliseconds
         """
-        # Log available fields for debugging
-        logger.debug(f"Build fields: {list(build.keys())}")
-
-        # First, determine the job name (for the JOB NAME column)
-        if 'jobName' in build:
-            job_name = build['jobName']
-        elif 'jobFullName' in build:
-            job_name = build['jobFullName']
-        elif 'jobDisplayName' in build:
-            job_name = build['jobDisplayName']
-        elif 'job' in build and 'name' in build['job']:
-            job_name = build['job']['name']
-        elif 'job' in build and 'fullName' in build['job']:
-            job_name = build['job']['fullName']
-        else:
-            # Fall back to URL parsing if job name not available
-            job_name = self._get_job_name_from_url(build.get('url', ''))
-
-        # Now, determine the build display name
-        # This should be different from the job name and include build-specific information
-        build_number = build.get('number', 'N/A')
-
-        # Try different fields for display name in order of preference
-        if 'fullDisplayName' in build and build['fullDisplayName']:
-            # Extract just the build-specific part if possible
-            full_display = build['fullDisplayName']
-
-            # If the full display starts with the job name, try to extract just the build part
-            if full_display.startswith(job_name):
-                build_display = full_display[len(job_name):].strip()
-            else:
-                build_display = full_display
-        elif 'displayName' in build and build['displayName']:
-            build_display = build['displayName']
-        else:
-            # Fall back to just the build number
-            build_display = f"#{build_number}"
-
-        # If the build display is empty or just whitespace, use the build number
-        if not build_display or build_display.isspace():
-            build_display = f"#{build_number}"
-
-        # If build display doesn't start with #, add it for clarity
-        if not build_display.startswith('#'):
-            build_display = f"#{build_number} - {build_display}"
-
-        # Calculate progress percentage
         progress_pct = 0
-        if 'estimatedDuration' in build and build['estimatedDuration'] > 0 and 'timestamp' in build:
-            elapsed = int(time.time() * 1000) - build['timestamp']
-            progress_pct = min(100, int((elapsed / build['estimatedDuration']) * 100))
-
-        # Calculate remaining time
         remaining = "Unknown"
+
         if 'estimatedDuration' in build and build['estimatedDuration'] > 0 and 'timestamp' in build:
-            current_time = int(time.time() * 1000)
-            time_elapsed = current_time - build['timestamp']
-            time_remaining = build['estimatedDuration'] - time_elapsed
+            # Calculate progress percentage
+            elapsed = now_ms - build['timestamp']
+            progress_pct = min(100, int((elapsed / build['estimatedDuration']) * 100))
 
+            # Calculate remaining time in integer arithmetic
+            time_remaining = build['estimatedDuration'] - elapsed
             if time_remaining <= 0:
                 remaining = "Overdue"
             else:
-                minutes = int(time_remaining / 60000)
-                seconds = int((time_remaining % 60000) / 1000)
+                minutes, seconds = divmod(time_remaining // 1000, 60)
                 remaining = f"{minutes}m {seconds}s"
 
-        # Log what we've determined
-        logger.info(f"JOB NAME: {job_name}")
-        logger.info(f"BUILD DISPLAY: {build_display}")
-
-        return {
-            'id': build.get('id', 'unknown'),
-            'job_name': job_name,
-            'build_number': build_number,
-            'build_display': build_display,
-            'estimated_duration': f"{build.get('estimatedDuration', 0) / 60000:.1f}m",
-            'progress': progress_pct,
-            'remaining': remaining,
-            'url': build.get('url', ''),
-            'timestamp': build.get('timestamp', 0)
-        }
+        info['progress'] = progress_pct
+        info['remaining'] = remaining
 
     def _get_queue_info(self, queue_item):
         """
@@ -171,20 +176,22 @@ class JenkinsDashboardData:
         :param queue_item: Queue item information dictionary
         :return: Dictionary with formatted queue information
         """
+        _get = queue_item.get
+
         job_name = "Unknown"
-        if 'task' in queue_item and 'name' in queue_item['task']:
-            job_name = queue_item['task']['name']
+        task = _get('task')
+        if task and 'name' in task:
+            job_name = task['name']
 
-        why = queue_item.get('why', 'Unknown reason')
+        why = _get('why', 'Unknown reason')
 
         # Calculate how long the item has been in queue
         queue_time = "Unknown"
         waiting_ms = 0
-        if 'inQueueSince' in queue_item:
-            queue_time_ms = queue_item['inQueueSince']
+        queue_time_ms = _get('inQueueSince')
+        if queue_time_ms is not None:
             waiting_ms = int(time.time() * 1000) - queue_time_ms
-            minutes = int(waiting_ms / 60000)
-            seconds = int((waiting_ms % 60000) / 1000)
+            minutes, seconds = divmod(waiting_ms // 1000, 60)
 
             if minutes > 0:
                 queue_time = f"{minutes}m {seconds}s"
@@ -192,70 +199,178 @@ class JenkinsDashboardData:
                 queue_time = f"{seconds}s"
 
         return {
-            'id': queue_item.get('id', 'N/A'),
+            'id': _get('id', 'N/A'),
             'job_name': job_name,
             'why': why,
             'waiting_time': queue_time,
             'waiting_ms': waiting_ms,
-            'queued_since': queue_item.get('inQueueSince', 0)
+            'queued_since': queue_time_ms or 0
         }
 
     def _refresh_data_thread(self):
         """
         Background thread to refresh dashboard data periodically.
         """
-        while not self.stop_thread:
+        _refresh = self.refresh_data
+        _wait = self._stop_event.wait
+
+        while not self._stop_event.is_set():
             try:
-                self.refresh_data()
+                _refresh()
             except Exception as e:
                 logger.error(f"Error in refresh thread: {e}")
-                self.dashboard_data['error'] = str(e)
+                self._publish(dict(self.dashboard_data, error=str(e)))
 
-            # Sleep for the refresh interval
-            for _ in range(self.refresh_interval * 10):
-                if self.stop_thread:
-                    break
-                time.sleep(0.1)
+            # One interruptible wait instead of a 100ms sleep-poll; returns
+            # immediately when shutdown() sets the event
+            _wait(self.refresh_interval)
+
+    def _is_unchanged_and_idle(self):
+        """
+        Probe Jenkins with two tiny tree queries and report whether nothing
+        changed since the previous refresh and no build is in flight.
+
+        Only the idle case is skippable: while builds run, progress and
+        remaining-time fields need recomputing even if the build set is stable.
+        The job probe only sees top-level jobs (builds inside folders or
+        multibranch projects are invisible to it), so the published dashboard
+        state must also be empty before the skip is taken.
+
+        :return: True when the full refresh can be skipped
+        """
+        try:
+            probe = self.connector.get_jenkins_info('/api/json', params={'tree': _PROBE_TREE})
+            queue_probe = self.connector.get_jenkins_info('/queue/api/json', params={'tree': _QUEUE_PROBE_TREE})
+        except Exception as e:
+            logger.debug("Change probe failed, doing a full refresh: %s", e)
+            return False
+
+        if not isinstance(probe, dict) or not isinstance(queue_probe, dict):
+            return False
+
+        last_builds = [(job.get('name'), job.get('lastBuild') or {}) for job in probe.get('jobs', [])]
+        snapshot = (
+            frozenset((name, lb.get('number'), lb.get('building')) for name, lb in last_builds),
+            frozenset(item.get('id') for item in queue_probe.get('items', []))
+        )
+
+        unchanged = (
+            snapshot == self._prev_snapshot
+            and not any(lb.get('building') for _, lb in last_builds)
+            and not snapshot[1]
+            and not self.dashboard_data.get('running_builds')
+            and not self.dashboard_data.get('queued_builds')
+            and self.dashboard_data.get('error') is None
+        )
+        self._prev_snapshot = snapshot
+        return unchanged
 
     def refresh_data(self):
         """
         Refresh all dashboard data.
         """
+        # One timestamp per refresh cycle, reused by every branch below
+        now_str = time.strftime('%Y-%m-%d %H:%M:%S')
+
         try:
             logger.info("Refreshing dashboard data...")
 
-            # Force connection refresh to avoid stale data
-            if hasattr(self.connector, 'session'):
-                self.connector.session.close()
-
-            # Get running builds
-            running_builds = self.connector.get_running_builds()
-            formatted_builds = [self._get_build_info(build) for build in running_builds]
-
-            # Sort running builds by progress (descending)
-            formatted_builds.sort(key=lambda x: x['progress'], reverse=True)
-
-            # Get queued builds
-            queued_builds = self.connector.get_build_queue()
-            formatted_queue = [self._get_queue_info(item) for item in queued_builds]
+            # Cheap change probe first: when the (job, build, building) set and
+            # the queue ids match the previous refresh and nothing is running,
+            # there is nothing to re-format - just bump the timestamp
+            if self._is_unchanged_and_idle():
+                logger.debug("No changes since last refresh, skipping rebuild")
+                self._publish(dict(self.dashboard_data, timestamp=now_str))
+                return
+
+            # Issue both independent fetches concurrently so the refresh
+            # takes max(t1, t2) instead of t1 + t2
+            future_running = self._fetch_pool.submit(self.connector.get_running_builds)
+            future_queue = self._fetch_pool.submit(self.connector.get_build_queue, tree=_QUEUE_TREE)
+
+            # Get running builds; sample the clock once for the whole batch
+            # and fill a pre-sized list rather than growing one
+            running_builds = future_running.result()
+            now_ms = int(time.time() * 1000)
+            formatted_builds = [None] * len(running_builds)
+            for i, build in enumerate(running_builds):
+                formatted_builds[i] = self._get_build_info(build, now_ms)
+
+            # Evict cache entries for builds that are no longer running
+            current_keys = {(build.get('url'), build.get('number')) for build in running_builds}
+            self._build_cache = {k: v for k, v in self._build_cache.items() if k in current_keys}
+
+            # Top running builds by progress (descending); nlargest is
+            # O(M log N) versus O(M log M) for a full sort
+            formatted_builds = heapq.nlargest(
+                _MAX_RUNNING_BUILDS, formatted_builds, key=operator.itemgetter('progress'))
+
+            # Get queued builds, fetching only the fields we format
+            queued_builds = future_queue.result()
+            formatted_queue = [None] * len(queued_builds)
+            for i, item in enumerate(queued_builds):
+                formatted_queue[i] = self._get_queue_info(item)
 
             # Sort queued builds by waiting time (descending)
-            formatted_queue.sort(key=lambda x: x['waiting_ms'], reverse=True)
+            formatted_queue.sort(key=operator.itemgetter('waiting_ms'), reverse=True)
 
-            # Update dashboard data
-            self.dashboard_data = {
+            # Publish the finished snapshot in one atomic swap
+            self._publish({
                 'running_builds': formatted_builds,
                 'queued_builds': formatted_queue,
-                'timestamp': datetime.now().strftime('%Y-%m-%d %H:%M:%S'),
+                'timestamp': now_str,
                 'error': None
-            }
+            })
 
             logger.info(f"Dashboard data refreshed: {len(formatted_builds)} running, {len(formatted_queue)} queued")
 
         except Exception as e:
             logger.error(f"Error refreshing data: {e}")
-            self.dashboard_data['error'] = str(e)
-            self.dashboard_data['timestamp'] = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+            self._publish(dict(self.dashboard_data, error=str(e), timestamp=now_str))
+
+    def _publish(self, new_data):
+        """
+        Atomically swap in a fully-built dashboard snapshot.
+
+        Readers only ever see complete snapshots: the worker builds the dict
+        (and its JSON encoding) off to the side, then rebinds the attributes,
+        which is atomic in CPython.
+
+        :param new_data: Complete dashboard data dictionary
+        """
+        self._dashboard_json_bytes = json.dumps(new_data).encode()
+        self.dashboard_data = new_data
+
+        # Push the snapshot to any streaming subscribers; a full queue means
+        # the client is behind, so the stale update is simply dropped
+        with self._subscribers_lock:
+            subscribers = list(self._subscribers)
+        for sub in subscribers:
+            try:
+                sub.put_nowait(new_data)
+            except queue.Full:
+                pass
+
+    def subscribe(self):
+        """
+        Register a streaming subscriber.
+
+        :return: Bounded queue.Queue that receives each published snapshot
+        """
+        sub = queue.Queue(maxsize=4)
+        with self._subscribers_lock:
+            self._subscribers.append(sub)
+        return sub
+
+    def unsubscribe(self, sub):
+        """
+        Remove a streaming subscriber.
+
+        :param sub: Queue previously returned by subscribe()
+        """
+        with self._subscribers_lock:
+            if sub in self._subscribers:
+                self._subscribers.remove(sub)
 
     def get_data(self):
         """
@@ -265,11 +380,23 @@ class JenkinsDashboardData:
         """
         return self.dashboard_data
 
+    def get_json_bytes(self):
+        """
+        Get the current dashboard data pre-encoded as JSON bytes.
+
+        Encoded once per refresh by the worker thread, so endpoints can serve
+        it directly without a per-request json.dumps.
+
+        :return: JSON-encoded dashboard data as bytes
+        """
+        return self._dashboard_json_bytes
+
     def shutdown(self):
         """
         Clean shutdown of the dashboard data provider.
         """
-        self.stop_thread = True
+        self._stop_event.set()
         if self.data_thread.is_alive():
             self.data_thread.join(2)
-            logger.info("Dashboard data thread stopped")
\ No newline at end of file
+            logger.info("Dashboard data thread stopped")
+        self._fetch_pool.shutdown(wait=False)
\ No newline at end of file
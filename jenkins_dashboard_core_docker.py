@@ -2,26 +2,101 @@
 
 import os
 import json
+import functools
 import logging
+import logging.handlers
+import queue
 import time
 import threading
 import re  # For regex pattern matching
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from flask import Flask, render_template, jsonify
 
 # Import the JenkinsConnector from your module
 from jenkins_connector_docker import JenkinsConnector, JenkinsAuthenticationError
+from jenkins_formatters import job_name_from_url
 
-# Configure logging - ensure logs go to a location accessible in Docker
+# Configure logging - ensure logs go to a location accessible in Docker.
+# Records buffer in a MemoryHandler and flush to disk in batches (or at once
+# on ERROR), so hot-path log lines don't each pay a synchronous write.
+# Guarded so re-imports (e.g. additional gunicorn workers) skip the
+# directory stat and handler setup when logging is already configured
 log_directory = 'logs'
-os.makedirs(log_directory, exist_ok=True)
-logging.basicConfig(
-    filename=os.path.join(log_directory, 'jenkins_web_dashboard.log'),
-    level=logging.INFO,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
-)
+if not logging.getLogger().handlers:
+    os.makedirs(log_directory, exist_ok=True)
+    _file_handler = logging.FileHandler(os.path.join(log_directory, 'jenkins_web_dashboard.log'))
+    _file_handler.setFormatter(logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s'))
+    _buffered_handler = logging.handlers.MemoryHandler(
+        capacity=200, flushLevel=logging.ERROR, target=_file_handler)
+    logging.basicConfig(level=logging.INFO, handlers=[_buffered_handler])
 logger = logging.getLogger(__name__)
 
+# Branch extraction helpers, compiled/built once rather than per build
+_BRANCH_RE = re.compile(r'branch[:\s]+([^\s\]]+)', re.IGNORECASE)
+_BRANCH_PARAM_NAMES = frozenset({'branch', 'git_branch'})
+
+# Upper bound for the per-instance formatted-build caches
+_CACHE_MAX = 512
+
+
+@functools.lru_cache(maxsize=1024)
+def _format_build_timestamp(timestamp_ms):
+    """
+    Format a build timestamp (ms) as Y-m-d H:M:S.
+
+    Completed builds keep the same timestamp forever, so the same 20 or so
+    values recur on every refresh; the cache turns repeats into a dict hit.
+
+    :param timestamp_ms: Build timestamp in milliseconds
+    :return: Formatted timestamp string
+    """
+    return datetime.fromtimestamp(timestamp_ms / 1000).strftime('%Y-%m-%d %H:%M:%S')
+
+
+@functools.lru_cache(maxsize=1024)
+def _format_duration(duration_ms):
+    """
+    Format a duration in milliseconds as minutes with one decimal.
+
+    :param duration_ms: Duration in milliseconds
+    :return: Formatted duration string
+    """
+    return f"{duration_ms / 60000:.1f}m"
+
+
+def _branch_from_actions(actions):
+    """
+    Extract a branch name from a build's actions list.
+
+    Build parameters take priority; cause descriptions are the fallback.
+    One flat pass, locals only - this runs per build on every refresh.
+
+    :param actions: List of action dictionaries from a build
+    :return: Branch name or None
+    """
+    causes_branch = None
+    for action in actions:
+        parameters = action.get('parameters')
+        if parameters:
+            for param in parameters:
+                if param.get('name', '').lower() in _BRANCH_PARAM_NAMES:
+                    return param.get('value', '')
+
+        if causes_branch is None:
+            for cause in action.get('causes', ()):
+                desc = cause.get('shortDescription')
+                if desc and 'branch' in desc.lower():
+                    # Try to extract branch from description
+                    branch_parts = desc.split('branch')
+                    if len(branch_parts) > 1:
+                        potential_branch = branch_parts[1].strip().strip(':').strip()
+                        if potential_branch:
+                            causes_branch = potential_branch
+                            break
+    return causes_branch
+
 class JenkinsDashboardData:
     def __init__(self, jenkins_url=None):
         """
@@ -40,6 +115,15 @@ class JenkinsDashboardData:
         self.connector = JenkinsConnector(jenkins_url=self.jenkins_url)
 
         self.refresh_interval = int(os.environ.get('REFRESH_INTERVAL', 30))  # seconds
+
+        # Small pool so the three independent Jenkins fetches overlap their
+        # network latency instead of running back to back
+        self._fetch_pool = ThreadPoolExecutor(max_workers=3, thread_name_prefix='jenkins-fetch')
+
+        # Bounded LRU caches of formatted builds; the same builds come back
+        # refresh after refresh, so only progress/remaining need recomputing
+        self._build_cache = OrderedDict()
+        self._completed_cache = OrderedDict()
         self.dashboard_data = {
             'running_builds': [],
             'queued_builds': [],
@@ -48,161 +132,130 @@ class JenkinsDashboardData:
             'error': None
         }
 
+        # SSE subscribers: each gets a bounded queue fed on every refresh
+        self._subscribers = []
+        self._subscribers_lock = threading.Lock()
+
+        # Publish bookkeeping: the lock guards the snapshot swap, the wake
+        # event lets API handlers pull a refresh forward, and _last_refresh
+        # records when a snapshot was last published
+        self._data_lock = threading.Lock()
+        self._wake = threading.Event()
+        self._last_refresh = 0.0
+
+        # Single-flight guard: at most one refresh talks to Jenkins at a
+        # time; concurrent callers wait on the done event instead
+        self._refresh_lock = threading.Lock()
+        self._refresh_done = threading.Event()
+
         # Start background refresh thread
-        self.stop_thread = False
+        self._stop_event = threading.Event()
         self.data_thread = threading.Thread(target=self._refresh_data_thread)
         self.data_thread.daemon = True
         self.data_thread.start()
 
-    def _get_job_name_from_url(self, url):
-        """
-        Extract the job name from a Jenkins URL.
-
-        :param url: Jenkins URL for the job
-        :return: Job name
+    def _get_build_info(self, build, now_ms):
         """
-        if not url:
-            return "Unknown"
-
-        # Remove trailing slash if present
-        if url.endswith('/'):
-            url = url[:-1]
+        Extract relevant information from a build.
 
-        # Get the last part of the URL
-        job_parts = url.split('/')
+        Static fields (names, branch, duration, url) are cached across
+        refreshes; only progress and remaining time are recomputed.
 
-        # The job name is typically the last part after 'job'
-        for i, part in enumerate(job_parts):
-            if part == 'job' and i + 1 < len(job_parts):
-                return job_parts[i + 1]
+        :param build: Build information dictionary
+        :param now_ms: Current time in milliseconds
+        :return: Dictionary with formatted build information
+        """
+        # The display name and estimated duration participate in the key so
+        # a renamed or re-estimated build invalidates its cached entry
+        key = (build.get('url'), build.get('id'),
+               build.get('fullDisplayName'), build.get('estimatedDuration'))
+        static = self._build_cache.get(key)
+        if static is None:
+            static = self._static_build_info(build)
+            self._build_cache[key] = static
+            if len(self._build_cache) > _CACHE_MAX:
+                self._build_cache.popitem(last=False)
+        else:
+            self._build_cache.move_to_end(key)
 
-        # If we can't determine the job name, return the last part
-        return job_parts[-1]
+        info = dict(static)
+        self._apply_progress(build, info, now_ms)
+        return info
 
-    def _get_build_info(self, build):
+    def _static_build_info(self, build):
         """
-        Extract relevant information from a build.
+        Compute the refresh-invariant fields of a build's display dict.
 
         :param build: Build information dictionary
-        :return: Dictionary with formatted build information
+        :return: Dictionary with the static formatted build information
         """
-        # Log available fields for debugging
-        logger.debug(f"Build fields: {list(build.keys())}")
-
-        # First, determine the job name (for the JOB NAME column)
-        if 'jobName' in build:
-            job_name = build['jobName']
-        elif 'jobFullName' in build:
-            job_name = build['jobFullName']
-        elif 'jobDisplayName' in build:
-            job_name = build['jobDisplayName']
-        elif 'job' in build and 'name' in build['job']:
-            job_name = build['job']['name']
-        elif 'job' in build and 'fullName' in build['job']:
-            job_name = build['job']['fullName']
-        else:
-            # Fall back to URL parsing if job name not available
-            job_name = self._get_job_name_from_url(build.get('url', ''))
+        # Log available fields for debugging; guard so the key list is not
+        # even built when DEBUG is off
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Build fields: %s", list(build.keys()))
+
+        # First, determine the job name (for the JOB NAME column); one
+        # get() per candidate instead of paired membership test + subscript,
+        # with URL parsing as the final fallback
+        job = build.get('job') or {}
+        job_name = (build.get('jobName')
+                    or build.get('jobFullName')
+                    or build.get('jobDisplayName')
+                    or job.get('name')
+                    or job.get('fullName')
+                    or job_name_from_url(build.get('url', '')))
 
         # Now, determine the build display name
         # This should be different from the job name and include build-specific information
         build_number = build.get('number', 'N/A')
 
-        # Try to extract branch information from various possible sources
-        branch = None
-
-        # Check for parameters that might contain branch info
-        if 'actions' in build:
-            for action in build.get('actions', []):
-                # Check for parameters action
-                if 'parameters' in action:
-                    for param in action['parameters']:
-                        if param.get('name', '').lower() in ['branch', 'git_branch']:
-                            branch = param.get('value', '')
-                            logger.info(f"Found branch in parameters: {branch}")
-                            break
-
-                # Check for causes which might contain branch info
-                if 'causes' in action:
-                    for cause in action.get('causes', []):
-                        if 'shortDescription' in cause:
-                            desc = cause['shortDescription']
-                            if 'branch' in desc.lower():
-                                # Try to extract branch from description
-                                branch_parts = desc.split('branch')
-                                if len(branch_parts) > 1:
-                                    potential_branch = branch_parts[1].strip().strip(':').strip()
-                                    if potential_branch and not branch:  # Don't overwrite if we already found a branch
-                                        branch = potential_branch
-                                        logger.info(f"Found branch in cause description: {branch}")
+        # Try to extract branch information from parameters or causes
+        branch = _branch_from_actions(build.get('actions', ()))
+        if branch:
+            logger.debug("Found branch in build actions: %s", branch)
 
         # Also check for any branch info in the display name or full display name
         if not branch:
             full_display = build.get('fullDisplayName', '')
             if 'branch' in full_display.lower():
-                branch_match = re.search(r'branch[:\s]+([^\s\]]+)', full_display, re.IGNORECASE)
+                branch_match = _BRANCH_RE.search(full_display)
                 if branch_match:
                     branch = branch_match.group(1)
-                    logger.info(f"Found branch in full display name: {branch}")
-
-        # Try different fields for display name in order of preference
-        if 'fullDisplayName' in build and build['fullDisplayName']:
-            # Extract just the build-specific part if possible
-            full_display = build['fullDisplayName']
-
-            # If the full display starts with the job name, try to extract just the build part
-            if full_display.startswith(job_name):
-                build_display = full_display[len(job_name):].strip()
-            else:
-                build_display = full_display
-        elif 'displayName' in build and build['displayName']:
-            build_display = build['displayName']
+                    logger.debug("Found branch in full display name: %s", branch)
+
+        # Try different fields for display name in order of preference;
+        # removeprefix is a no-op when the display doesn't start with the
+        # job name
+        full_display = build.get('fullDisplayName')
+        if full_display:
+            base = full_display.removeprefix(job_name).strip()
+        elif build.get('displayName'):
+            base = build['displayName'].strip()
         else:
-            # Fall back to just the build number
-            build_display = f"#{build_number}"
-
-        # If the build display is empty or just whitespace, use the build number
-        if not build_display or build_display.isspace():
-            build_display = f"#{build_number}"
-
-        # If build display doesn't start with #, add it for clarity
-        if not build_display.startswith('#'):
-            build_display = f"#{build_number} - {build_display}"
-
-        # Check if 'devops' appears in the display for staging builds and needs branch info
-        if ' - devops' in build_display and branch:
-            # Format: #381 - devops - [branch]
-            if not f" - [{branch}]" in build_display:
-                build_display = build_display + f" - [{branch}]"
-        # For other builds, add branch if it's available and not already in the display
-        elif branch and not f"[{branch}]" in build_display:
-            build_display = build_display + f" - [{branch}]"
-
-        # Calculate progress percentage
-        progress_pct = 0
-        if 'estimatedDuration' in build and build['estimatedDuration'] > 0 and 'timestamp' in build:
-            elapsed = int(time.time() * 1000) - build['timestamp']
-            progress_pct = min(100, int((elapsed / build['estimatedDuration']) * 100))
+            base = ''
+
+        # Accumulate the display pieces and join once, instead of growing
+        # the string through repeated concatenations
+        if not base:
+            parts = [f"#{build_number}"]
+        elif base.startswith('#'):
+            parts = [base]
+        else:
+            # Prefix the build number for clarity
+            parts = [f"#{build_number}", base]
 
-        # Calculate remaining time
-        remaining = "Unknown"
-        if 'estimatedDuration' in build and build['estimatedDuration'] > 0 and 'timestamp' in build:
-            current_time = int(time.time() * 1000)
-            time_elapsed = current_time - build['timestamp']
-            time_remaining = build['estimatedDuration'] - time_elapsed
+        # Add branch info if available and not already in the display
+        if branch and f"[{branch}]" not in base:
+            parts.append(f"[{branch}]")
 
-            if time_remaining <= 0:
-                remaining = "Overdue"
-            else:
-                minutes = int(time_remaining / 60000)
-                seconds = int((time_remaining % 60000) / 1000)
-                remaining = f"{minutes}m {seconds}s"
+        build_display = ' - '.join(parts)
 
         # Log what we've determined
-        logger.info(f"JOB NAME: {job_name}")
-        logger.info(f"BUILD DISPLAY: {build_display}")
-        if branch:
-            logger.info(f"BRANCH: {branch}")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("JOB NAME: %s", job_name)
+            logger.debug("BUILD DISPLAY: %s", build_display)
+            if branch:
+                logger.debug("BRANCH: %s", branch)
 
         return {
             'id': build.get('id', 'unknown'),
@@ -210,34 +263,76 @@ class JenkinsDashboardData:
             'build_number': build_number,
             'build_display': build_display,
             'estimated_duration': f"{build.get('estimatedDuration', 0) / 60000:.1f}m",
-            'progress': progress_pct,
-            'remaining': remaining,
             'url': build.get('url', ''),
             'timestamp': build.get('timestamp', 0),
             'branch': branch
         }
 
+    def _apply_progress(self, build, info, now_ms):
+        """
+        Set the time-varying progress and remaining fields on a build dict.
+
+        :param build: Build information dictionary
+        :param info: Formatted build dict to update in place
+        :param now_ms: Current time in milliseconds
+        """
+        progress_pct = 0
+        remaining = "Unknown"
+
+        if 'estimatedDuration' in build and build['estimatedDuration'] > 0 and 'timestamp' in build:
+            # Calculate progress percentage
+            elapsed = now_ms - build['timestamp']
+            progress_pct = min(100, int((elapsed / build['estimatedDuration']) * 100))
+
+            # Calculate remaining time
+            time_remaining = build['estimatedDuration'] - elapsed
+            if time_remaining <= 0:
+                remaining = "Overdue"
+            else:
+                minutes = int(time_remaining / 60000)
+                seconds = int((time_remaining % 60000) / 1000)
+                remaining = f"{minutes}m {seconds}s"
+
+        info['progress'] = progress_pct
+        info['remaining'] = remaining
+
     def _get_completed_build_info(self, build):
         """
         Extract relevant information from a completed build.
 
+        Completed builds never change, so results are cached across
+        refreshes keyed by (url, id, result).
+
+        :param build: Build information dictionary
+        :return: Dictionary with formatted build information
+        """
+        key = (build.get('url'), build.get('id'), build.get('result'))
+        cached = self._completed_cache.get(key)
+        if cached is not None:
+            self._completed_cache.move_to_end(key)
+            return cached
+
+        info = self._format_completed_build(build)
+        self._completed_cache[key] = info
+        if len(self._completed_cache) > _CACHE_MAX:
+            self._completed_cache.popitem(last=False)
+        return info
+
+    def _format_completed_build(self, build):
+        """
+        Format the display dict for a completed build.
+
         :param build: Build information dictionary
         :return: Dictionary with formatted build information
         """
         # Many of the same steps as _get_build_info
         # First, determine the job name
-        if 'jobName' in build:
-            job_name = build['jobName']
-        elif 'fullDisplayName' in build:
-            # Try to extract job name from fullDisplayName (format usually: "job_name #number")
-            parts = build['fullDisplayName'].split(' #', 1)
-            if len(parts) == 2:
-                job_name = parts[0]
-            else:
-                job_name = self._get_job_name_from_url(build.get('url', ''))
-        else:
-            # Fall back to URL parsing if job name not available
-            job_name = self._get_job_name_from_url(build.get('url', ''))
+        job_name = build.get('jobName')
+        if not job_name:
+            # Try to extract job name from fullDisplayName (format usually: "job_name #number"),
+            # falling back to URL parsing
+            name_part, sep, _ = build.get('fullDisplayName', '').partition(' #')
+            job_name = name_part if sep else job_name_from_url(build.get('url', ''))
 
         # Get the build number
         build_number = build.get('number', 'N/A')
@@ -246,22 +341,13 @@ class JenkinsDashboardData:
         result = build.get('result', 'UNKNOWN')
 
         # Format duration
-        duration_ms = build.get('duration', 0)
-        duration = f"{duration_ms / 60000:.1f}m"
+        duration = _format_duration(build.get('duration', 0))
 
         # Format timestamp
-        timestamp_ms = build.get('timestamp', 0)
-        timestamp = datetime.fromtimestamp(timestamp_ms / 1000).strftime('%Y-%m-%d %H:%M:%S')
-
-        # Extract branch information (simplified version)
-        branch = None
-        if 'actions' in build:
-            for action in build.get('actions', []):
-                if 'parameters' in action:
-                    for param in action['parameters']:
-                        if param.get('name', '').lower() in ['branch', 'git_branch']:
-                            branch = param.get('value', '')
-                            break
+        timestamp = _format_build_timestamp(build.get('timestamp', 0))
+
+        # Extract branch information
+        branch = _branch_from_actions(build.get('actions', ()))
 
         return {
             'id': build.get('id', 'unknown'),
@@ -274,11 +360,12 @@ class JenkinsDashboardData:
             'branch': branch
         }
 
-    def _get_queue_info(self, queue_item):
+    def _get_queue_info(self, queue_item, now_ms):
         """
         Extract relevant information from a queued build.
 
         :param queue_item: Queue item information dictionary
+        :param now_ms: Current time in milliseconds
         :return: Dictionary with formatted queue information
         """
         job_name = "Unknown"
@@ -292,7 +379,7 @@ class JenkinsDashboardData:
         waiting_ms = 0
         if 'inQueueSince' in queue_item:
             queue_time_ms = queue_item['inQueueSince']
-            waiting_ms = int(time.time() * 1000) - queue_time_ms
+            waiting_ms = now_ms - queue_time_ms
             minutes = int(waiting_ms / 60000)
             seconds = int((waiting_ms % 60000) / 1000)
 
@@ -314,23 +401,47 @@ class JenkinsDashboardData:
         """
         Background thread to refresh dashboard data periodically.
         """
-        while not self.stop_thread:
+        while not self._stop_event.is_set():
             try:
                 self.refresh_data()
             except Exception as e:
                 logger.error(f"Error in refresh thread: {e}")
-                self.dashboard_data['error'] = str(e)
+                with self._data_lock:
+                    self.dashboard_data = dict(self.dashboard_data, error=str(e))
 
-            # Sleep for the refresh interval
-            for _ in range(self.refresh_interval * 10):
-                if self.stop_thread:
-                    break
-                time.sleep(0.1)
+            # One interruptible wait instead of a 100ms sleep-poll;
+            # request_refresh() or shutdown() cuts it short
+            self._wake.wait(self.refresh_interval)
+            self._wake.clear()
 
     def refresh_data(self):
         """
         Refresh all dashboard data.
+
+        Coalesces concurrent callers: whoever arrives while a refresh is in
+        flight waits for that refresh to publish rather than starting a
+        duplicate round of Jenkins fetches.
         """
+        if not self._refresh_lock.acquire(blocking=False):
+            self._refresh_done.wait(timeout=5)
+            return
+
+        self._refresh_done.clear()
+        try:
+            self._refresh_data_locked()
+        finally:
+            self._refresh_done.set()
+            self._refresh_lock.release()
+
+    def _refresh_data_locked(self):
+        """
+        Run one refresh cycle. Callers must hold the refresh lock.
+        """
+        # Sample the clock once per refresh; every per-build and per-item
+        # calculation below reuses these
+        now_ms = int(time.time() * 1000)
+        now_str = datetime.fromtimestamp(now_ms / 1000).strftime('%Y-%m-%d %H:%M:%S')
+
         try:
             logger.info("Refreshing dashboard data...")
 
@@ -340,10 +451,16 @@ class JenkinsDashboardData:
             formatted_latest = []
             errors = []
 
+            # Issue the three independent fetches concurrently so the refresh
+            # takes max(t1, t2, t3) instead of t1 + t2 + t3
+            future_running = self._fetch_pool.submit(self.connector.get_running_builds)
+            future_queue = self._fetch_pool.submit(self.connector.get_build_queue)
+            future_latest = self._fetch_pool.submit(self.connector.get_latest_builds, limit=20)
+
             # Get running builds - handle potential failures gracefully
             try:
-                running_builds = self.connector.get_running_builds()
-                formatted_builds = [self._get_build_info(build) for build in running_builds]
+                running_builds = future_running.result()
+                formatted_builds = [self._get_build_info(build, now_ms) for build in running_builds]
                 # Sort running builds by progress (descending)
                 formatted_builds.sort(key=lambda x: x['progress'], reverse=True)
             except Exception as e:
@@ -353,8 +470,8 @@ class JenkinsDashboardData:
 
             # Get queued builds - handle potential failures gracefully
             try:
-                queued_builds = self.connector.get_build_queue()
-                formatted_queue = [self._get_queue_info(item) for item in queued_builds]
+                queued_builds = future_queue.result()
+                formatted_queue = [self._get_queue_info(item, now_ms) for item in queued_builds]
                 # Sort queued builds by waiting time (descending)
                 formatted_queue.sort(key=lambda x: x['waiting_ms'], reverse=True)
             except Exception as e:
@@ -364,7 +481,7 @@ class JenkinsDashboardData:
 
             # Get latest builds (new feature) - handle potential failures gracefully
             try:
-                latest_builds = self.connector.get_latest_builds(limit=20)
+                latest_builds = future_latest.result()
                 formatted_latest = [self._get_completed_build_info(build) for build in latest_builds]
             except Exception as e:
                 error_msg = f"Error fetching latest builds: {str(e)}"
@@ -377,20 +494,65 @@ class JenkinsDashboardData:
                 error_message = "; ".join(errors)
 
             # Update dashboard data with what we have, even if some parts failed
-            self.dashboard_data = {
-                'running_builds': formatted_builds,
-                'queued_builds': formatted_queue,
-                'latest_builds': formatted_latest,
-                'timestamp': datetime.now().strftime('%Y-%m-%d %H:%M:%S'),
-                'error': error_message
-            }
+            with self._data_lock:
+                self.dashboard_data = {
+                    'running_builds': formatted_builds,
+                    'queued_builds': formatted_queue,
+                    'latest_builds': formatted_latest,
+                    'timestamp': now_str,
+                    'error': error_message
+                }
+                self._last_refresh = time.time()
+            self._notify_subscribers(self.dashboard_data)
 
             logger.info(f"Dashboard data refreshed: {len(formatted_builds)} running, {len(formatted_queue)} queued, {len(formatted_latest)} latest")
 
         except Exception as e:
             logger.error(f"Error refreshing data: {e}")
-            self.dashboard_data['error'] = str(e)
-            self.dashboard_data['timestamp'] = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+            with self._data_lock:
+                self.dashboard_data = dict(
+                    self.dashboard_data,
+                    error=str(e),
+                    timestamp=now_str
+                )
+
+    def _notify_subscribers(self, data):
+        """
+        Push a refreshed snapshot to all streaming subscribers.
+
+        A full queue means the client is behind, so the stale update is
+        simply dropped.
+
+        :param data: Dashboard data dictionary to push
+        """
+        with self._subscribers_lock:
+            subscribers = list(self._subscribers)
+        for sub in subscribers:
+            try:
+                sub.put_nowait(data)
+            except queue.Full:
+                pass
+
+    def subscribe(self):
+        """
+        Register a streaming subscriber.
+
+        :return: Bounded queue.Queue that receives each refreshed snapshot
+        """
+        sub = queue.Queue(maxsize=4)
+        with self._subscribers_lock:
+            self._subscribers.append(sub)
+        return sub
+
+    def unsubscribe(self, sub):
+        """
+        Remove a streaming subscriber.
+
+        :param sub: Queue previously returned by subscribe()
+        """
+        with self._subscribers_lock:
+            if sub in self._subscribers:
+                self._subscribers.remove(sub)
 
     def get_data(self):
         """
@@ -400,11 +562,30 @@ class JenkinsDashboardData:
         """
         return self.dashboard_data
 
+    def data_age(self):
+        """
+        Get the age of the current dashboard data in seconds.
+
+        :return: Seconds since the last published refresh
+        """
+        return time.time() - self._last_refresh
+
+    def request_refresh(self):
+        """
+        Ask the background thread for a refresh ahead of schedule.
+
+        Returns immediately; the refresh runs on the background thread, never
+        on the caller's.
+        """
+        self._wake.set()
+
     def shutdown(self):
         """
         Clean shutdown of the dashboard data provider.
         """
-        self.stop_thread = True
+        self._stop_event.set()
+        self._wake.set()
         if self.data_thread.is_alive():
             self.data_thread.join(2)
-            logger.info("Dashboard data thread stopped")
\ No newline at end of file
+            logger.info("Dashboard data thread stopped")
+        self._fetch_pool.shutdown(wait=False)
\ No newline at end of file
@@ -1,16 +1,24 @@
 # jenkins_dashboard_web.py
 
 import os
-from flask import Flask, render_template, jsonify, request, send_from_directory
+import json
+import atexit
+from flask import Flask, render_template, jsonify, request, send_from_directory, Response
 from jenkins_dashboard_core_docker import JenkinsDashboardData
 import logging
 
-# Configure logging
-logging.basicConfig(
-    filename='jenkins_web_dashboard.log',
-    level=logging.INFO,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
-)
+# Use orjson for response encoding when available; it is several times
+# faster than the stdlib for these small-dict payloads
+try:
+    import orjson
+
+    def _dumps(obj):
+        return orjson.dumps(obj)
+except ImportError:
+    def _dumps(obj):
+        return json.dumps(obj).encode()
+
+# Logging is configured by the dashboard core module imported above
 logger = logging.getLogger(__name__)
 
 # Create Flask app
@@ -33,16 +41,40 @@ def index():
 @app.route('/api/dashboard')
 def api_dashboard():
     """API endpoint for dashboard data."""
-    # Force data refresh on each request
-    dashboard_data.refresh_data()
+    # Serve the cached snapshot; the background thread owns freshness.
+    # ?max_age=N asks for an early refresh when the data is older than N
+    # seconds - the refresh still runs off the request thread
+    max_age = request.args.get('max_age', type=float)
+    if max_age is not None and dashboard_data.data_age() > max_age:
+        dashboard_data.request_refresh()
 
     # Add cache control headers to prevent browser caching
-    response = jsonify(dashboard_data.get_data())
+    response = Response(_dumps(dashboard_data.get_data()), mimetype='application/json')
     response.headers['Cache-Control'] = 'no-cache, no-store, must-revalidate'
     response.headers['Pragma'] = 'no-cache'
     response.headers['Expires'] = '0'
     return response
 
+@app.route('/stream')
+def stream():
+    """Server-Sent Events endpoint pushing dashboard updates as they refresh."""
+    sub = dashboard_data.subscribe()
+
+    def generate():
+        try:
+            # Send the current snapshot immediately so clients render at once
+            yield b'data: ' + _dumps(dashboard_data.get_data()) + b'\n\n'
+            while True:
+                data = sub.get()
+                yield b'data: ' + _dumps(data) + b'\n\n'
+        finally:
+            dashboard_data.unsubscribe(sub)
+
+    response = Response(generate(), mimetype='text/event-stream')
+    response.headers['Cache-Control'] = 'no-cache'
+    response.headers['X-Accel-Buffering'] = 'no'
+    return response
+
 @app.route('/api/refresh', methods=['POST'])
 def api_refresh():
     """API endpoint to force a data refresh."""
@@ -53,10 +85,9 @@ def api_refresh():
         logger.error(f"Error during forced refresh: {e}")
         return jsonify({'status': 'error', 'message': str(e)}), 500
 
-@app.teardown_appcontext
-def shutdown_dashboard(exception=None):
-    """Clean shutdown when Flask app exits."""
-    dashboard_data.shutdown()
+# Shut the provider down at process exit; teardown_appcontext would fire
+# after every request and kill the background refresh thread
+atexit.register(dashboard_data.shutdown)
 
 def create_directories():
     """Create necessary directories if they don't exist."""
@@ -87,4 +118,5 @@ if __name__ == '__main__':
     # Run the Flask app
     print("Starting Jenkins Web Dashboard...")
     logger.info("Starting Jenkins Web Dashboard...")
-    app.run(debug=True, host='0.0.0.0', port=5000)
\ No newline at end of file
+    # Dev server for local runs only; production uses gunicorn via wsgi.py
+    app.run(debug=False, host='0.0.0.0', port=5000)
\ No newline at end of file
@@ -1,17 +1,31 @@
 # jenkins_dashboard_web.py
 
 import os
+import json
+import atexit
 import threading
-from flask import Flask, render_template, jsonify, request, send_from_directory
+from flask import Flask, render_template, jsonify, request, send_from_directory, Response
 from jenkins_dashboard_core_docker import JenkinsDashboardData
 import logging
 
-# Configure logging
-logging.basicConfig(
-    filename='logs/jenkins_web_dashboard.log',
-    level=logging.INFO,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
-)
+# Use orjson for response encoding when available; it is several times
+# faster than the stdlib for these small-dict payloads
+try:
+    import orjson
+
+    def _dumps(obj):
+        return orjson.dumps(obj)
+except ImportError:
+    def _dumps(obj):
+        return json.dumps(obj).encode()
+
+# Optional binary serializer for clients that negotiate msgpack
+try:
+    import ormsgpack
+except ImportError:
+    ormsgpack = None
+
+# Logging is configured by the dashboard core module imported above
 logger = logging.getLogger(__name__)
 
 # Create Flask app
@@ -36,35 +50,26 @@ def index():
 @app.route('/api/dashboard')
 def api_dashboard():
     """API endpoint for dashboard data."""
-    try:
-        # Force data refresh but set a timeout
-        refresh_thread = threading.Thread(target=dashboard_data.refresh_data)
-        refresh_thread.daemon = True
-        refresh_thread.start()
-
-        # Wait for the refresh to complete, but not too long
-        refresh_thread.join(timeout=5)
-
-        # Get whatever data we have, even if incomplete
-        data = dashboard_data.get_data()
-
-        # If the refresh is still running, note that in the response
-        if refresh_thread.is_alive():
-            if data['error']:
-                data['error'] += "; Some data may be incomplete (refresh still in progress)"
-            else:
-                data['error'] = "Some data may be incomplete (refresh still in progress)"
-    except Exception as e:
-        logger.error(f"Error in dashboard API endpoint: {e}")
-        # Return whatever data we have, with the error noted
-        data = dashboard_data.get_data()
-        if data['error']:
-            data['error'] += f"; Additional error: {str(e)}"
-        else:
-            data['error'] = str(e)
+    # Serve the cached snapshot; the background thread owns freshness.
+    # ?max_age=N asks for an early refresh when the data is older than N
+    # seconds - the refresh still runs off the request thread
+    max_age = request.args.get('max_age', type=float)
+    if max_age is not None and dashboard_data.data_age() > max_age:
+        dashboard_data.request_refresh()
+
+    data = dashboard_data.get_data()
+
+    # Content negotiation: msgpack is ~30-40% smaller and faster to encode
+    # for clients that ask for it; JSON stays the default. best_match keeps
+    # wildcard Accept headers (browsers send */*) on JSON
+    offered = ('application/json', 'application/msgpack')
+    best = request.accept_mimetypes.best_match(offered, default='application/json')
+    if ormsgpack is not None and best == 'application/msgpack':
+        response = Response(ormsgpack.packb(data), mimetype='application/msgpack')
+    else:
+        response = Response(_dumps(data), mimetype='application/json')
 
     # Add cache control headers to prevent browser caching
-    response = jsonify(data)
     response.headers['Cache-Control'] = 'no-cache, no-store, must-revalidate'
     response.headers['Pragma'] = 'no-cache'
     response.headers['Expires'] = '0'
@@ -80,10 +85,9 @@ def api_refresh():
         logger.error(f"Error during forced refresh: {e}")
         return jsonify({'status': 'error', 'message': str(e)}), 500
 
-@app.teardown_appcontext
-def shutdown_dashboard(exception=None):
-    """Clean shutdown when Flask app exits."""
-    dashboard_data.shutdown()
+# Shut the provider down at process exit; teardown_appcontext would fire
+# after every request and kill the background refresh thread
+atexit.register(dashboard_data.shutdown)
 
 def create_directories():
     """Create necessary directories if they don't exist."""
@@ -0,0 +1,87 @@
+# jenkins_formatters.py
+
+import re
+
+# Matches the job segment of a Jenkins URL, e.g. /job/my-job/42/
+_JOB_RE = re.compile(r'/job/([^/]+)')
+
+# Build fields that may carry the job name, in order of preference
+_JOB_NAME_FIELDS = ('jobName', 'jobFullName', 'jobDisplayName')
+
+
+def job_name_from_url(url):
+    """
+    Extract the job name from a Jenkins URL.
+
+    :param url: Jenkins URL for the job
+    :return: Job name
+    """
+    if not url:
+        return "Unknown"
+
+    match = _JOB_RE.search(url)
+    if match:
+        return match.group(1)
+
+    # If we can't determine the job name, return the last path segment
+    return url.rstrip('/').rsplit('/', 1)[-1]
+
+
+def job_name_from_build(build):
+    """
+    Determine the job name for a build dictionary.
+
+    :param build: Build information dictionary
+    :return: Job name
+    """
+    for key in _JOB_NAME_FIELDS:
+        value = build.get(key)
+        if value:
+            return value
+
+    job = build.get('job')
+    if job:
+        value = job.get('name') or job.get('fullName')
+        if value:
+            return value
+
+    # Fall back to URL parsing if job name not available
+    return job_name_from_url(build.get('url', ''))
+
+
+def build_display_name(build, job_name):
+    """
+    Determine the display name for a build (the BUILD column).
+
+    This should be different from the job name and include build-specific
+    information such as the build number.
+
+    :param build: Build information dictionary
+    :param job_name: Job name already resolved for this build
+    :return: Build display string
+    """
+    build_number = build.get('number', 'N/A')
+
+    # Try different fields for display name in order of preference
+    full_display = build.get('fullDisplayName')
+    if full_display:
+        # If the full display starts with the job name, try to extract just the build part
+        if full_display.startswith(job_name):
+            build_display = full_display[len(job_name):].strip()
+        else:
+            build_display = full_display
+    elif build.get('displayName'):
+        build_display = build['displayName']
+    else:
+        # Fall back to just the build number
+        build_display = f"#{build_number}"
+
+    # If the build display is empty or just whitespace, use the build number
+    if not build_display or build_display.isspace():
+        build_display = f"#{build_number}"
+
+    # If build display doesn't start with #, add it for clarity
+    if not build_display.startswith('#'):
+        build_display = f"#{build_number} - {build_display}"
+
+    return build_display
@@ -13,6 +13,8 @@ setup(
         "Flask>=2.2.0",
         "Flask-Cors>=3.0.10",
         "pytz>=2022.1",
+        "gunicorn>=20.1.0",
+        "gevent>=22.10.0",
     ],
     extras_require={
         "windows": ["windows-curses>=2.3.0"],
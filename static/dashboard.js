@@ -4,6 +4,7 @@
 const REFRESH_INTERVAL = 30; // seconds
 let autoRefreshEnabled = true;
 let refreshTimer = null;
+let eventSource = null;
 
 // DOM Elements
 const elements = {
@@ -39,26 +40,78 @@ function initDashboard() {
   // Initial data fetch
   fetchDashboardData();
 
-  // Set up auto-refresh
-  startAutoRefresh();
+  // Subscribe to pushed updates; falls back to polling if unavailable
+  connectEventSource();
 
   console.log("Dashboard initialized");
 }
 
+// Subscribe to the server's SSE stream so updates arrive as soon as the
+// background refresh publishes them; the poll timer is only a fallback
+function connectEventSource() {
+  if (eventSource) {
+    return;
+  }
+
+  if (!window.EventSource) {
+    console.log("EventSource not supported, falling back to polling");
+    startAutoRefresh();
+    return;
+  }
+
+  console.log("Connecting to /stream for push updates");
+  eventSource = new EventSource("/stream");
+
+  eventSource.onopen = () => {
+    console.log("Update stream connected, pausing poll timer");
+    stopAutoRefresh();
+  };
+
+  eventSource.onmessage = (event) => {
+    updateDashboard(JSON.parse(event.data));
+  };
+
+  eventSource.onerror = () => {
+    // The browser retries the stream automatically; poll in the
+    // meantime so the dashboard keeps updating while it is down
+    console.log("Update stream error, polling until it reconnects");
+    if (autoRefreshEnabled && !refreshTimer) {
+      startAutoRefresh();
+    }
+  };
+}
+
+// Close the SSE stream
+function disconnectEventSource() {
+  if (eventSource) {
+    console.log("Closing update stream");
+    eventSource.close();
+    eventSource = null;
+  }
+}
+
 // Toggle auto-refresh
 function toggleAutoRefresh() {
   autoRefreshEnabled = elements.autoRefreshToggle.checked;
   console.log(`Auto-refresh ${autoRefreshEnabled ? "enabled" : "disabled"}`);
 
   if (autoRefreshEnabled) {
+    connectEventSource();
     startAutoRefresh();
   } else {
     stopAutoRefresh();
+    disconnectEventSource();
   }
 }
 
 // Start auto-refresh timer
 function startAutoRefresh() {
+  // The push stream already delivers updates; no need to poll on top
+  if (eventSource && eventSource.readyState === EventSource.OPEN) {
+    console.log("Push stream active, poll timer not needed");
+    return;
+  }
+
   console.log("Starting auto-refresh timer");
 
   if (refreshTimer) {
@@ -307,16 +360,18 @@ document.addEventListener("DOMContentLoaded", () => {
 // Handle page visibility changes to pause/resume auto-refresh
 document.addEventListener("visibilitychange", () => {
   if (document.visibilityState === "visible") {
-    console.log("Page became visible, resuming auto-refresh");
-    // Page is visible, fetch latest data and restart auto-refresh
+    console.log("Page became visible, resuming updates");
+    // Page is visible, fetch latest data and resubscribe to updates
     if (autoRefreshEnabled) {
       fetchDashboardData();
+      connectEventSource();
       startAutoRefresh();
     }
   } else {
-    console.log("Page hidden, pausing auto-refresh");
-    // Page is hidden, pause auto-refresh to save resources
+    console.log("Page hidden, pausing updates");
+    // Page is hidden, pause updates to save resources
     stopAutoRefresh();
+    disconnectEventSource();
   }
 });
 
@@ -0,0 +1,15 @@
+# wsgi.py
+
+"""
+Gunicorn entry point for the dockerized dashboard.
+
+Run with:
+    gunicorn -k gevent -w 1 -b 0.0.0.0:5000 --worker-connections 1000 wsgi:application
+"""
+
+from jenkins_dashboard_web_docker import app, create_directories
+
+# Ensure logs/templates/static exist before the first request
+create_directories()
+
+application = app